@@ -3,6 +3,8 @@
 
 import os
 import json
+import pickle
+import struct
 import joblib
 import numpy as np
 import pandas as pd
@@ -28,6 +30,47 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Header for models saved with pickle protocol 5; anything else is a legacy joblib file
+MODEL_FILE_MAGIC = b"PKL5"
+
+# Bump whenever the tracking tables change so init_database re-runs the DDL
+SCHEMA_VERSION = 1
+
+def _save_model(path: str, model) -> None:
+    """Save a model with pickle protocol 5, writing numpy buffers out-of-band"""
+    buffers = []
+    payload = pickle.dumps(model, protocol=5, buffer_callback=buffers.append)
+    raw_buffers = [buf.raw() for buf in buffers]
+    
+    with open(path, 'wb') as f:
+        # Manifest: magic, buffer count, payload size, then each buffer size
+        f.write(MODEL_FILE_MAGIC)
+        f.write(struct.pack('<QQ', len(raw_buffers), len(payload)))
+        for raw in raw_buffers:
+            f.write(struct.pack('<Q', raw.nbytes))
+        f.write(payload)
+        for raw in raw_buffers:
+            f.write(raw)
+
+def _load_model(path: str):
+    """Load a model saved by _save_model, falling back to joblib for legacy files"""
+    with open(path, 'rb') as f:
+        if f.read(len(MODEL_FILE_MAGIC)) != MODEL_FILE_MAGIC:
+            return joblib.load(path)
+        
+        buffer_count, payload_size = struct.unpack('<QQ', f.read(16))
+        sizes = struct.unpack(f'<{buffer_count}Q', f.read(8 * buffer_count))
+        payload = f.read(payload_size)
+        buffers = []
+        for size in sizes:
+            # Read straight into a preallocated buffer instead of copying bytes
+            buf = bytearray(size)
+            if f.readinto(buf) != size:
+                raise ValueError(f"Model file {path} is truncated")
+            buffers.append(buf)
+    
+    return pickle.loads(payload, buffers=buffers)
+
 class ModelManager:
     """Manages ML model lifecycle including versioning and deployment"""
     
@@ -40,47 +83,73 @@ class ModelManager:
         # Create models directory
         os.makedirs(models_dir, exist_ok=True)
         
-        # Initialize database for tracking
-        self.init_database()
+        # Database for tracking is opened lazily on first use; the lock stops
+        # the monitor thread and the main thread from both opening it
+        self._conn = None
+        self._db_lock = threading.RLock()
         
         logger.info("ModelManager initialized")
     
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """SQLite connection, opened on first use"""
+        if self._conn is None:
+            with self._db_lock:
+                if self._conn is None:
+                    self.init_database()
+        return self._conn
+    
     def init_database(self):
         """Initialize SQLite database for model tracking"""
-        self.conn = sqlite3.connect('ml_system.db', check_same_thread=False)
-        self.conn.execute('''
-            CREATE TABLE IF NOT EXISTS model_versions (
-                version TEXT PRIMARY KEY,
-                created_at TEXT,
-                r2_score REAL,
-                rmse REAL,
-                training_samples INTEGER,
-                status TEXT
-            )
-        ''')
-        
-        self.conn.execute('''
-            CREATE TABLE IF NOT EXISTS predictions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT,
-                model_version TEXT,
-                input_features TEXT,
-                prediction REAL,
-                confidence REAL
-            )
-        ''')
-        
-        self.conn.execute('''
-            CREATE TABLE IF NOT EXISTS model_performance (
-                timestamp TEXT,
-                model_version TEXT,
-                metric_name TEXT,
-                metric_value REAL
-            )
-        ''')
-        
-        self.conn.commit()
-        logger.info("Database initialized")
+        with self._db_lock:
+            self.close()
+            conn = sqlite3.connect('ml_system.db', check_same_thread=False)
+            
+            # Skip the DDL entirely when the schema is already current
+            user_version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if user_version == SCHEMA_VERSION:
+                logger.info("Database schema up to date")
+            else:
+                conn.executescript(f'''
+                    CREATE TABLE IF NOT EXISTS model_versions (
+                        version TEXT PRIMARY KEY,
+                        created_at TEXT,
+                        r2_score REAL,
+                        rmse REAL,
+                        training_samples INTEGER,
+                        status TEXT
+                    );
+                    
+                    CREATE TABLE IF NOT EXISTS predictions (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        timestamp TEXT,
+                        model_version TEXT,
+                        input_features TEXT,
+                        prediction REAL,
+                        confidence REAL
+                    );
+                    
+                    CREATE TABLE IF NOT EXISTS model_performance (
+                        timestamp TEXT,
+                        model_version TEXT,
+                        metric_name TEXT,
+                        metric_value REAL
+                    );
+                    
+                    PRAGMA user_version = {SCHEMA_VERSION};
+                ''')
+                conn.commit()
+                logger.info("Database initialized")
+            
+            # Publish the connection only once the tables exist
+            self._conn = conn
+    
+    def close(self):
+        """Close the tracking database connection if it is open"""
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
     
     def train_new_model(self, X_train: np.ndarray, y_train: np.ndarray, 
                        X_test: np.ndarray, y_test: np.ndarray) -> str:
@@ -103,7 +172,7 @@ class ModelManager:
         
         # Save model
         model_path = os.path.join(self.models_dir, f"model_{version}.pkl")
-        joblib.dump(model, model_path)
+        _save_model(model_path, model)
         
         # Save metadata
         metadata = {
@@ -142,7 +211,7 @@ class ModelManager:
                 return False
             
             # Load model and metadata
-            self.current_model = joblib.load(model_path)
+            self.current_model = _load_model(model_path)
             with open(metadata_path) as f:
                 self.model_metadata = json.load(f)
             
@@ -454,7 +523,7 @@ class ProductionMLSystem:
         """Gracefully shutdown the system"""
         logger.info("Shutting down production ML system...")
         self.monitor.stop_monitoring()
-        self.model_manager.conn.close()
+        self.model_manager.close()
         logger.info("System shutdown complete")
 
 # Example usage and demo
@@ -0,0 +1,47 @@
+# forecast_helpers.py
+# Shared pieces used by both forecast dashboards in this folder
+
+import numpy as np
+
+# Optional Numba acceleration for the error metrics; plain NumPy works the same without it
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Column types for sales_data.csv
+SALES_DTYPES = {'sales': np.float32, 'day_of_week': np.int8, 'day_number': np.int32}
+
+def _mae_rmse_numpy(y_true, y_pred):
+    """Mean absolute error and root mean squared error from one residual array"""
+    residuals = y_pred - y_true
+    return np.abs(residuals).mean(), np.sqrt((residuals * residuals).mean())
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def mae_rmse(y_true, y_pred):
+        """Mean absolute error and root mean squared error in a single loop"""
+        abs_sum = 0.0
+        sq_sum = 0.0
+        n = y_true.shape[0]
+        for i in range(n):
+            diff = y_pred[i] - y_true[i]
+            abs_sum += abs(diff)
+            sq_sum += diff * diff
+        return abs_sum / n, (sq_sum / n) ** 0.5
+else:
+    mae_rmse = _mae_rmse_numpy
+
+def daily_sales_stats(data):
+    """Mean and standard deviation of sales for each day of the week"""
+    # np.bincount aggregates the 7 buckets in one pass, no hashing like groupby
+    dow = data['day_of_week'].to_numpy()
+    sales = data['sales'].to_numpy(dtype=np.float64)
+    counts = np.bincount(dow, minlength=7)
+    sums = np.bincount(dow, weights=sales, minlength=7)
+    sq_sums = np.bincount(dow, weights=sales * sales, minlength=7)
+    
+    means = sums / counts
+    # Sample standard deviation (ddof=1), same as pandas .std()
+    stds = np.sqrt(np.maximum(0, (sq_sums - sums * means) / (counts - 1)))
+    return means, stds
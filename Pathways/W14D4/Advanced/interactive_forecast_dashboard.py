@@ -8,22 +8,32 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from sklearn.linear_model import LinearRegression
 from sklearn.ensemble import RandomForestRegressor
-from sklearn.metrics import mean_absolute_error, mean_squared_error
 import warnings
 warnings.filterwarnings('ignore')
 
+# Simplify long line paths when rendering
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+
+# Error metrics, sales column types and day-of-week stats shared with the other dashboard
+from forecast_helpers import SALES_DTYPES, daily_sales_stats, mae_rmse
+
 class ForecastDashboard:
     def __init__(self):
         self.data = None
         self.models = {}
         self.predictions = {}
         self.future_predictions = {}
+        self.metrics = {}
+        self._lr_weights = None
+        self._fig = None
+        self._artists = None
         
     def load_data(self, filename='sales_data.csv'):
         """Load and prepare data for forecasting"""
         try:
-            self.data = pd.read_csv(filename)
-            self.data['date'] = pd.to_datetime(self.data['date'])
+            # Parse dates and set compact dtypes while reading, in one pass
+            self.data = pd.read_csv(filename, parse_dates=['date'], dtype=SALES_DTYPES)
             print(f"✓ Data loaded: {len(self.data)} records")
             return True
         except FileNotFoundError:
@@ -37,25 +47,47 @@ class ForecastDashboard:
             return
         
         # Prepare features
-        X = self.data[['day_number', 'day_of_week']]
-        y = self.data['sales']
+        # Convert to NumPy once; every fit and predict below shares these arrays
+        X = self.data[['day_number', 'day_of_week']].to_numpy(dtype=np.float64)
+        y = self.data['sales'].to_numpy(dtype=np.float64)
         
         # Train different models
         models_to_train = {
             'Linear Regression': LinearRegression(),
-            'Random Forest': RandomForestRegressor(n_estimators=100, random_state=42)
+            # Small, shallow forest: two features and a few hundred rows don't need more
+            'Random Forest': RandomForestRegressor(
+                n_estimators=50,
+                max_depth=6,
+                min_samples_leaf=3,
+                random_state=42,
+                n_jobs=-1  # Use all CPU cores
+            )
         }
         
         for name, model in models_to_train.items():
             model.fit(X, y)
-            predictions = model.predict(X)
-            mae = mean_absolute_error(y, predictions)
+            if isinstance(model, LinearRegression):
+                # Keep the fitted line as plain arrays so predictions skip sklearn's wrapper
+                self._lr_weights = (model.coef_.astype(np.float64), float(model.intercept_))
+            predictions = self._predict(model, X)
+            
+            # One pass over the residuals gives both error metrics
+            mae, rmse = mae_rmse(y, np.asarray(predictions, dtype=np.float64))
             
             self.models[name] = model
-            self.predictions[name] = predictions
+            # Historical fits are only plotted, so a float32 copy is precise enough
+            self.predictions[name] = predictions.astype(np.float32)
+            self.metrics[name] = {'mae': mae, 'rmse': rmse}
             
             print(f"✓ {name} trained - MAE: ${mae:.2f}")
     
+    def _predict(self, model, X):
+        """Predict with a trained model, using a direct dot product for the linear model"""
+        if isinstance(model, LinearRegression) and self._lr_weights is not None:
+            weights, intercept = self._lr_weights
+            return np.asarray(X, dtype=np.float64) @ weights + intercept
+        return model.predict(X)
+    
     def generate_future_forecasts(self, days_ahead=14):
         """Generate future predictions with multiple models"""
         if not self.models:
@@ -68,20 +100,17 @@ class ForecastDashboard:
         future_dates = pd.date_range(start=last_date + pd.Timedelta(days=1), 
                                    periods=days_ahead, freq='D')
         
-        # Prepare future features
-        future_X = []
-        for i, date in enumerate(future_dates):
-            day_num = last_day + i + 1
-            day_of_week = date.dayofweek
-            future_X.append([day_num, day_of_week])
-        
-        future_X = np.array(future_X)
+        # Prepare future features (vectorized - no per-day Python loop)
+        day_nums = np.arange(last_day + 1, last_day + 1 + days_ahead, dtype=np.int64)
+        days_of_week = future_dates.dayofweek.values.astype(np.int64)
+        # C-contiguous float64 lets sklearn use the array without copying it
+        future_X = np.ascontiguousarray(np.stack([day_nums, days_of_week], axis=1), dtype=np.float64)
         
         # Generate predictions for each model
         future_df = pd.DataFrame({'date': future_dates})
         
         for name, model in self.models.items():
-            predictions = model.predict(future_X)
+            predictions = self._predict(model, future_X)
             future_df[f'{name}_prediction'] = predictions
             self.future_predictions[name] = predictions
         
@@ -94,19 +123,38 @@ class ForecastDashboard:
             print("❌ Data or models not ready!")
             return
         
+        # Build the figure once; later calls only push new data into the existing artists.
+        # If the window was closed, pyplot no longer shows that figure, so build a new one
+        if (self._artists is None
+                or not plt.fignum_exists(self._fig.number)
+                or set(self._artists['fit_lines']) != set(self.predictions)
+                or set(self._artists['forecast_lines']) != set(self.future_predictions)):
+            self._build_dashboard()
+        else:
+            self._update_dashboard()
+        
+        # Save the dashboard before showing it (tight_layout has already run)
+        self._fig.savefig('advanced_forecast_dashboard.png', dpi=150)
+        print("✓ Dashboard saved as 'advanced_forecast_dashboard.png'")
+        
+        plt.show()
+    
+    def _build_dashboard(self):
+        """Create the dashboard figure and keep handles to every artist that holds data"""
         # Create subplots
         fig, axes = plt.subplots(2, 2, figsize=(15, 12))
         fig.suptitle('Advanced Sales Forecasting Dashboard', fontsize=16, fontweight='bold')
         
         # Plot 1: Historical data with model comparisons
         ax1 = axes[0, 0]
-        ax1.plot(self.data['date'], self.data['sales'], 'ko-', 
-                label='Actual Sales', markersize=3, linewidth=2)
+        actual_line, = ax1.plot(self.data['date'], self.data['sales'], 'ko-', 
+                               label='Actual Sales', markersize=3, linewidth=2)
         
         colors = ['red', 'blue', 'green', 'orange']
+        fit_lines = {}
         for i, (name, pred) in enumerate(self.predictions.items()):
-            ax1.plot(self.data['date'], pred, '--', 
-                    color=colors[i], label=f'{name} Fit', alpha=0.7)
+            fit_lines[name], = ax1.plot(self.data['date'], pred, '--', 
+                                       color=colors[i], label=f'{name} Fit', alpha=0.7)
         
         ax1.set_title('Historical Data & Model Fits')
         ax1.set_xlabel('Date')
@@ -118,12 +166,13 @@ class ForecastDashboard:
         ax2 = axes[0, 1]
         # Show last 10 days of historical data for context
         recent_data = self.data.tail(10)
-        ax2.plot(recent_data['date'], recent_data['sales'], 'ko-', 
-                label='Recent Actual', markersize=4)
+        recent_line, = ax2.plot(recent_data['date'], recent_data['sales'], 'ko-', 
+                               label='Recent Actual', markersize=4)
         
+        forecast_lines = {}
         for i, (name, pred) in enumerate(self.future_predictions.items()):
-            ax2.plot(self.future_df['date'], pred, 'o-', 
-                    color=colors[i], label=f'{name} Forecast', markersize=3)
+            forecast_lines[name], = ax2.plot(self.future_df['date'], pred, 'o-', 
+                                            color=colors[i], label=f'{name} Forecast', markersize=3)
         
         ax2.set_title('Future Forecasts Comparison')
         ax2.set_xlabel('Date')
@@ -134,8 +183,8 @@ class ForecastDashboard:
         # Plot 3: Sales by day of week
         ax3 = axes[1, 0]
         day_names = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-        daily_avg = self.data.groupby('day_of_week')['sales'].mean()
-        bars = ax3.bar(range(7), daily_avg.values, color='skyblue', alpha=0.7)
+        daily_avg, _ = daily_sales_stats(self.data)
+        bars = ax3.bar(range(7), daily_avg, color='skyblue', alpha=0.7)
         ax3.set_title('Average Sales by Day of Week')
         ax3.set_xlabel('Day of Week')
         ax3.set_ylabel('Average Sales ($)')
@@ -143,22 +192,19 @@ class ForecastDashboard:
         ax3.set_xticklabels(day_names)
         
         # Add value labels on bars
+        bar_labels = []
         for bar in bars:
             height = bar.get_height()
-            ax3.text(bar.get_x() + bar.get_width()/2., height + 1,
-                    f'${height:.0f}', ha='center', va='bottom')
+            bar_labels.append(ax3.text(bar.get_x() + bar.get_width()/2., height + 1,
+                                       f'${height:.0f}', ha='center', va='bottom'))
         
         # Plot 4: Model performance comparison
         ax4 = axes[1, 1]
-        model_names = list(self.models.keys())
-        mae_scores = []
-        rmse_scores = []
+        model_names = tuple(self.models)
         
-        for name in model_names:
-            mae = mean_absolute_error(self.data['sales'], self.predictions[name])
-            rmse = np.sqrt(mean_squared_error(self.data['sales'], self.predictions[name]))
-            mae_scores.append(mae)
-            rmse_scores.append(rmse)
+        # Reuse the metrics computed during training
+        mae_scores = [self.metrics[name]['mae'] for name in model_names]
+        rmse_scores = [self.metrics[name]['rmse'] for name in model_names]
         
         x = np.arange(len(model_names))
         width = 0.35
@@ -174,18 +220,68 @@ class ForecastDashboard:
         ax4.legend()
         
         # Add value labels
+        error_labels = []
         for bars in [bars1, bars2]:
+            labels = []
             for bar in bars:
                 height = bar.get_height()
-                ax4.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                        f'${height:.1f}', ha='center', va='bottom', fontsize=9)
+                labels.append(ax4.text(bar.get_x() + bar.get_width()/2., height + 0.5,
+                                       f'${height:.1f}', ha='center', va='bottom', fontsize=9))
+            error_labels.append(labels)
         
         plt.tight_layout()
-        plt.show()
         
-        # Save the dashboard
-        plt.savefig('advanced_forecast_dashboard.png', dpi=300, bbox_inches='tight')
-        print("✓ Dashboard saved as 'advanced_forecast_dashboard.png'")
+        self._fig = fig
+        self._artists = {
+            'axes': axes,
+            'actual_line': actual_line,
+            'fit_lines': fit_lines,
+            'recent_line': recent_line,
+            'forecast_lines': forecast_lines,
+            'day_bars': (bars, bar_labels),
+            'error_bars': [(bars1, error_labels[0]), (bars2, error_labels[1])],
+        }
+    
+    def _update_dashboard(self):
+        """Refresh the existing dashboard artists in place with the current data"""
+        artists = self._artists
+        
+        # Plot 1: historical data and model fits
+        artists['actual_line'].set_data(self.data['date'], self.data['sales'])
+        for name, line in artists['fit_lines'].items():
+            line.set_data(self.data['date'], self.predictions[name])
+        
+        # Plot 2: recent data and forecasts
+        recent_data = self.data.tail(10)
+        artists['recent_line'].set_data(recent_data['date'], recent_data['sales'])
+        for name, line in artists['forecast_lines'].items():
+            line.set_data(self.future_df['date'], self.future_predictions[name])
+        
+        # Plot 3: sales by day of week
+        daily_avg, _ = daily_sales_stats(self.data)
+        bars, labels = artists['day_bars']
+        self._set_bar_heights(bars, labels, daily_avg, 1, '${:.0f}')
+        
+        # Plot 4: model performance
+        model_names = tuple(self.models)
+        scores = [[self.metrics[name]['mae'] for name in model_names],
+                  [self.metrics[name]['rmse'] for name in model_names]]
+        for (bars, labels), heights in zip(artists['error_bars'], scores):
+            self._set_bar_heights(bars, labels, heights, 0.5, '${:.1f}')
+        
+        for ax in artists['axes'].flat:
+            ax.relim()
+            ax.autoscale_view()
+        
+        self._fig.canvas.draw_idle()
+    
+    @staticmethod
+    def _set_bar_heights(bars, labels, heights, label_offset, label_format):
+        """Update bar heights and move their value labels to match"""
+        for bar, label, height in zip(bars, labels, heights):
+            bar.set_height(height)
+            label.set_position((bar.get_x() + bar.get_width()/2., height + label_offset))
+            label.set_text(label_format.format(height))
     
     def print_forecast_summary(self):
         """Print a detailed forecast summary"""
@@ -193,17 +289,22 @@ class ForecastDashboard:
             print("❌ No future forecasts generated!")
             return
         
+        model_names = tuple(self.models)
+        
         print("\n" + "="*60)
         print("FORECAST SUMMARY")
         print("="*60)
         
-        for _, row in self.future_df.iterrows():
-            date_str = row['date'].strftime('%Y-%m-%d (%A)')
-            print(f"\n{date_str}:")
-            
-            for name in self.models.keys():
-                pred_col = f'{name}_prediction'
-                print(f"  {name}: ${row[pred_col]:.2f}")
+        # Format whole columns at once instead of iterating row by row
+        date_strs = self.future_df['date'].dt.strftime('%Y-%m-%d (%A)').values
+        model_values = [(name, self.future_df[f'{name}_prediction'].values)
+                        for name in model_names]
+        
+        lines = []
+        for i, date_str in enumerate(date_strs):
+            lines.append(f"\n{date_str}:")
+            lines.extend(f"  {name}: ${values[i]:.2f}" for name, values in model_values)
+        print("\n".join(lines))
         
         # Weekly summary
         if len(self.future_df) >= 7:
@@ -211,13 +312,13 @@ class ForecastDashboard:
             print("WEEKLY FORECAST SUMMARY")
             print("-"*40)
             
-            for name in self.models.keys():
+            # One pass over the first week for every prediction column
+            weekly = self.future_df.iloc[:7, 1:].agg(['sum', 'mean'])
+            for name in model_names:
                 pred_col = f'{name}_prediction'
-                weekly_total = self.future_df[pred_col].head(7).sum()
-                weekly_avg = self.future_df[pred_col].head(7).mean()
                 print(f"{name}:")
-                print(f"  Total week sales: ${weekly_total:.2f}")
-                print(f"  Average daily sales: ${weekly_avg:.2f}")
+                print(f"  Total week sales: ${weekly.at['sum', pred_col]:.2f}")
+                print(f"  Average daily sales: ${weekly.at['mean', pred_col]:.2f}")
 
 # Main execution
 if __name__ == "__main__":
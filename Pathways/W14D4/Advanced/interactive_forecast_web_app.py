@@ -10,11 +10,13 @@ from plotly.subplots import make_subplots
 import streamlit as st
 from sklearn.linear_model import LinearRegression
 from sklearn.ensemble import RandomForestRegressor
-from sklearn.metrics import mean_absolute_error
 import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+# Error metrics, sales column types and day-of-week stats shared with the other dashboard
+from forecast_helpers import SALES_DTYPES, daily_sales_stats, mae_rmse
+
 # Streamlit page configuration
 st.set_page_config(
     page_title="Sales Forecasting Dashboard",
@@ -22,6 +24,51 @@ st.set_page_config(
     layout="wide"
 )
 
+# Historical traces longer than this are downsampled before plotting
+MAX_CHART_POINTS = 2000
+
+def lttb_indices(x, y, n_out):
+    """Pick n_out point indices with Largest-Triangle-Three-Buckets downsampling"""
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    
+    # First and last points are always kept; the rest is split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = (end, edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        
+        # Keep the point forming the largest triangle with the previous pick and next average
+        areas = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) -
+                       (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(areas.argmax())
+        indices[i + 1] = a
+    
+    return indices
+
+@st.cache_data
+def data_insights(data):
+    """Summary numbers for the insights panel, computed once per data set"""
+    daily_mean, _ = daily_sales_stats(data)
+    best_day_idx = int(daily_mean.argmax())
+    return {
+        'best_day_idx': best_day_idx,
+        'best_day_sales': float(daily_mean[best_day_idx]),
+        'early_avg': float(data['sales'].iloc[:7].mean()),
+        'recent_avg': float(data['sales'].iloc[-7:].mean()),
+        'volatility': float(data['sales'].std())
+    }
+
 class InteractiveForecastApp:
     def __init__(self):
         self.data = None
@@ -32,8 +79,8 @@ class InteractiveForecastApp:
         """Create or load sample data"""
         # Try to load existing data first
         try:
-            data = pd.read_csv('sales_data.csv')
-            data['date'] = pd.to_datetime(data['date'])
+            # Parse dates and set compact dtypes while reading, in one pass
+            data = pd.read_csv('sales_data.csv', parse_dates=['date'], dtype=SALES_DTYPES)
         except FileNotFoundError:
             # Create sample data if file doesn't exist
             st.info("Creating sample data...")
@@ -53,20 +100,29 @@ class InteractiveForecastApp:
                 'sales': sales.round(2)
             })
             
-            data['day_of_week'] = data['date'].dt.dayofweek
-            data['day_number'] = range(1, len(data) + 1)
+            data['day_of_week'] = data['date'].dt.dayofweek.astype(np.int8)
+            data['day_number'] = np.arange(1, len(data) + 1, dtype=np.int32)
             
         _self.data = data
         return data
     
-    def train_models(self, data):
-        """Train multiple forecasting models"""
-        X = data[['day_number', 'day_of_week']]
-        y = data['sales']
+    @st.cache_resource
+    def train_models(_self, data, n_estimators=50, max_depth=6):
+        """Train multiple forecasting models (cached across reruns for the same data)"""
+        # Convert to NumPy once; every fit and predict below shares these arrays
+        X = data[['day_number', 'day_of_week']].to_numpy(dtype=np.float64)
+        y = data['sales'].to_numpy(dtype=np.float64)
         
         models = {
             'Linear Regression': LinearRegression(),
-            'Random Forest': RandomForestRegressor(n_estimators=100, random_state=42)
+            # Small, shallow forest: two features and a few hundred rows don't need more
+            'Random Forest': RandomForestRegressor(
+                n_estimators=n_estimators,
+                max_depth=max_depth,
+                min_samples_leaf=3,
+                random_state=42,
+                n_jobs=-1  # Use all CPU cores
+            )
         }
         
         trained_models = {}
@@ -75,15 +131,18 @@ class InteractiveForecastApp:
         for name, model in models.items():
             model.fit(X, y)
             predictions = model.predict(X)
-            mae = mean_absolute_error(y, predictions)
+            mae, _ = mae_rmse(y, np.asarray(predictions, dtype=np.float64))
             
             trained_models[name] = model
             model_scores[name] = mae
         
         return trained_models, model_scores
     
-    def generate_forecasts(self, models, data, days_ahead):
-        """Generate future forecasts"""
+    @st.cache_data
+    def generate_forecasts(_self, _models, data, days_ahead, n_estimators=50, max_depth=6):
+        """Generate future forecasts (cached per data set, forecast length and model settings)"""
+        # _models is not hashed, so n_estimators and max_depth are part of the
+        # cache key to make retrained models produce fresh forecasts
         last_day = data['day_number'].max()
         last_date = data['date'].max()
         
@@ -93,16 +152,13 @@ class InteractiveForecastApp:
             freq='D'
         )
         
-        future_X = []
-        for i, date in enumerate(future_dates):
-            day_num = last_day + i + 1
-            day_of_week = date.dayofweek
-            future_X.append([day_num, day_of_week])
-        
-        future_X = np.array(future_X)
+        day_nums = np.arange(last_day + 1, last_day + 1 + days_ahead, dtype=np.int64)
+        days_of_week = future_dates.dayofweek.values.astype(np.int64)
+        # C-contiguous float64 lets sklearn use the array without copying it
+        future_X = np.ascontiguousarray(np.stack([day_nums, days_of_week], axis=1), dtype=np.float64)
         
         forecasts = {'date': future_dates}
-        for name, model in models.items():
+        for name, model in _models.items():
             forecasts[name] = model.predict(future_X)
         
         return pd.DataFrame(forecasts)
@@ -111,28 +167,39 @@ class InteractiveForecastApp:
         """Create the main interactive forecast chart"""
         fig = go.Figure()
         
+        # Downsample long histories so render time depends on MAX_CHART_POINTS, not data size
+        if len(historical_data) > MAX_CHART_POINTS:
+            keep = lttb_indices(historical_data['date'].values.astype(np.int64),
+                                historical_data['sales'].values, MAX_CHART_POINTS)
+            historical_data = historical_data.iloc[keep]
+        
         # Historical data
-        fig.add_trace(go.Scatter(
+        traces = [go.Scatter(
             x=historical_data['date'],
             y=historical_data['sales'],
             mode='lines+markers',
             name='Historical Sales',
             line=dict(color='blue', width=3),
             marker=dict(size=6)
-        ))
+        )]
         
         # Forecast data for selected models
         colors = ['red', 'green', 'orange', 'purple']
-        for i, model in enumerate(selected_models):
-            if model in forecast_data.columns:
-                fig.add_trace(go.Scatter(
-                    x=forecast_data['date'],
-                    y=forecast_data[model],
-                    mode='lines+markers',
-                    name=f'{model} Forecast',
-                    line=dict(color=colors[i % len(colors)], width=2, dash='dash'),
-                    marker=dict(size=8)
-                ))
+        traces += [
+            go.Scatter(
+                x=forecast_data['date'],
+                y=forecast_data[model],
+                mode='lines+markers',
+                name=f'{model} Forecast',
+                line=dict(color=colors[i % len(colors)], width=2, dash='dash'),
+                marker=dict(size=8)
+            )
+            for i, model in enumerate(selected_models)
+            if model in forecast_data.columns
+        ]
+        
+        # Add every trace in one call so the figure is validated once
+        fig.add_traces(traces)
         
         fig.update_layout(
             title="Sales Forecast Dashboard",
@@ -146,8 +213,8 @@ class InteractiveForecastApp:
     
     def create_performance_chart(self, model_scores):
         """Create model performance comparison chart"""
-        models = list(model_scores.keys())
-        scores = list(model_scores.values())
+        models = tuple(model_scores)
+        scores = tuple(model_scores.values())
         
         fig = go.Figure(data=[
             go.Bar(x=models, y=scores, text=[f'${s:.2f}' for s in scores],
@@ -167,17 +234,16 @@ class InteractiveForecastApp:
         day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 
                     'Friday', 'Saturday', 'Sunday']
         
-        daily_avg = data.groupby('day_of_week')['sales'].agg(['mean', 'std']).reset_index()
-        daily_avg['day_name'] = [day_names[i] for i in daily_avg['day_of_week']]
+        daily_mean, daily_std = daily_sales_stats(data)
         
         fig = go.Figure()
         
         fig.add_trace(go.Bar(
-            x=daily_avg['day_name'],
-            y=daily_avg['mean'],
-            error_y=dict(type='data', array=daily_avg['std']),
+            x=day_names,
+            y=daily_mean,
+            error_y=dict(type='data', array=daily_std),
             name='Average Sales',
-            text=[f'${x:.0f}' for x in daily_avg['mean']],
+            text=[f'${x:.0f}' for x in daily_mean],
             textposition='auto'
         ))
         
@@ -218,13 +284,19 @@ def main():
         default=available_models
     )
     
+    # Random Forest size
+    st.sidebar.subheader("Model Settings")
+    n_estimators = st.sidebar.slider("Random Forest trees", 10, 200, 50, step=10)
+    max_depth = st.sidebar.slider("Random Forest max depth", 2, 12, 6)
+    
     # Train models
     with st.spinner("Training models..."):
-        models, model_scores = app.train_models(data)
+        models, model_scores = app.train_models(data, n_estimators, max_depth)
+    best_model = min(model_scores, key=model_scores.get)
     
     # Generate forecasts
     with st.spinner("Generating forecasts..."):
-        forecasts = app.generate_forecasts(models, data, days_ahead)
+        forecasts = app.generate_forecasts(models, data, days_ahead, n_estimators, max_depth)
     
     # Main dashboard
     col1, col2, col3 = st.columns(3)
@@ -238,7 +310,6 @@ def main():
     
     with col3:
         if selected_models:
-            best_model = min(model_scores.keys(), key=lambda x: model_scores[x])
             st.metric("Best Model", best_model, f"MAE: ${model_scores[best_model]:.2f}")
     
     # Main forecast chart
@@ -268,9 +339,9 @@ def main():
         display_forecasts = forecasts[['date'] + selected_models].copy()
         display_forecasts['date'] = display_forecasts['date'].dt.strftime('%Y-%m-%d (%A)')
         
-        # Format currency columns
-        for model in selected_models:
-            display_forecasts[model] = display_forecasts[model].apply(lambda x: f"${x:.2f}")
+        # Format all currency columns in one vectorized call
+        display_forecasts[selected_models] = np.char.mod(
+            '$%.2f', forecasts[selected_models].to_numpy())
         
         st.dataframe(display_forecasts, use_container_width=True)
         
@@ -292,27 +363,27 @@ def main():
     with st.expander("🔍 Data Insights"):
         st.write("**Key Insights from the Data:**")
         
+        insights = data_insights(data)
+        
         # Growth trend
-        recent_avg = data['sales'].tail(7).mean()
-        early_avg = data['sales'].head(7).mean()
+        recent_avg = insights['recent_avg']
+        early_avg = insights['early_avg']
         growth_rate = ((recent_avg - early_avg) / early_avg) * 100
         
         st.write(f"• **Growth Trend**: {growth_rate:+.1f}% change from early to recent period")
         
         # Best day
-        best_day_idx = data.groupby('day_of_week')['sales'].mean().idxmax()
         best_day_name = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 
-                        'Friday', 'Saturday', 'Sunday'][best_day_idx]
-        best_day_sales = data.groupby('day_of_week')['sales'].mean().max()
+                        'Friday', 'Saturday', 'Sunday'][insights['best_day_idx']]
+        best_day_sales = insights['best_day_sales']
         
         st.write(f"• **Best Sales Day**: {best_day_name} (avg: ${best_day_sales:.2f})")
         
         # Volatility
-        volatility = data['sales'].std()
+        volatility = insights['volatility']
         st.write(f"• **Sales Volatility**: ${volatility:.2f} standard deviation")
         
         # Model recommendations
-        best_model = min(model_scores.keys(), key=lambda x: model_scores[x])
         st.write(f"• **Recommended Model**: {best_model} (lowest error rate)")
     
     # Footer
@@ -20,8 +20,8 @@ print("Our sample data:")
 print(data.head(10))  # Show first 10 rows
 
 # Add some basic features that might help with forecasting
-data['day_of_week'] = data['date'].dt.dayofweek  # 0=Monday, 6=Sunday
-data['day_number'] = range(1, len(data) + 1)  # Sequential day number
+data['day_of_week'] = data['date'].dt.dayofweek.astype(np.int8)  # 0=Monday, 6=Sunday
+data['day_number'] = np.arange(1, len(data) + 1, dtype=np.int32)  # Sequential day number
 
 print("\nData with additional features:")
 print(data.head())
@@ -32,13 +32,10 @@ last_day = data['day_number'].max()
 future_dates = pd.date_range(start=data['date'].max() + pd.Timedelta(days=1), 
                            periods=future_days, freq='D')
 
-future_X = []
-for i, date in enumerate(future_dates):
-    day_num = last_day + i + 1
-    day_of_week = date.dayofweek
-    future_X.append([day_num, day_of_week])
-
-future_X = np.array(future_X)
+# Build all future features at once with NumPy instead of a loop
+day_nums = np.arange(last_day + 1, last_day + 1 + future_days, dtype=np.int64)
+days_of_week = future_dates.dayofweek.values.astype(np.int64)
+future_X = np.stack([day_nums, days_of_week], axis=1).astype(np.float64)
 future_predictions = model.predict(future_X)
 
 # Create the visualization
@@ -62,6 +59,10 @@ plt.grid(True, alpha=0.3)
 plt.xticks(rotation=45)
 plt.tight_layout()
 
+# Save the plot before showing it (showing can leave an empty figure behind)
+plt.savefig('sales_forecast.png', dpi=150)
+print("\nChart saved as 'sales_forecast.png'")
+
 # Show the plot
 plt.show()
 
@@ -70,7 +71,3 @@ print("\nFuture Predictions:")
 for i, (date, pred) in enumerate(zip(future_dates, future_predictions)):
     day_name = date.strftime('%A')
     print(f"{date.strftime('%Y-%m-%d')} ({day_name}): ${pred:.2f}")
-
-# Save the plot
-plt.savefig('sales_forecast.png', dpi=300, bbox_inches='tight')
-print("\nChart saved as 'sales_forecast.png'")
\ No newline at end of file
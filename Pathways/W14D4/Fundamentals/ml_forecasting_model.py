@@ -59,5 +59,6 @@ print("This means our predictions are off by about ${:.2f} on average".format(ma
 # Make a future prediction
 future_day = 31  # Day 31
 future_day_of_week = 1  # Tuesday
-future_prediction = model.predict([[future_day, future_day_of_week]])
+future_X_single = np.array([[future_day, future_day_of_week]], dtype=np.float64)  # 1 row, 2 features
+future_prediction = model.predict(future_X_single)
 print(f"\nPrediction for day {future_day} (Tuesday): ${future_prediction[0]:.2f}")
\ No newline at end of file
@@ -3,11 +3,38 @@
 
 print("=== Complete ML Testing Framework ===\n")
 
-import random
 import time
-from datetime import datetime
+import numpy as np
 from typing import List, Dict, Any, Optional, Tuple
 
+# Numba is optional; without it the same row loop runs as plain Python
+try:
+    from numba import njit, prange
+except ImportError:
+    prange = range
+    
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# Seeded generator so generated test data is reproducible between runs
+_RNG = np.random.default_rng(0)
+
+def _as_array(data) -> np.ndarray:
+    """Store numeric data as one contiguous float64 array instead of lists of boxed floats"""
+    return np.asarray(data, dtype=np.float64)
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _process_rows(arr):
+    """Count rows whose weighted sum is positive (rows are processed in parallel)"""
+    processed = 0
+    for i in prange(arr.shape[0]):
+        result = 0.0
+        for j in range(arr.shape[1]):
+            result += arr[i, j] * 0.1
+        if result > 0:
+            processed += 1
+    return processed
+
 # Import concepts from previous files
 class TestResult:
     """Stores the result of a test case"""
@@ -16,23 +43,27 @@ class TestResult:
         self.passed = passed
         self.message = message
         self.execution_time = execution_time
-        self.timestamp = datetime.now()
+        self.timestamp_ns = time.perf_counter_ns()  # monotonic, cheaper than a datetime object
 
 class MLTestFramework:
     """Comprehensive testing framework for ML applications"""
     
-    def __init__(self, name: str = "ML Test Suite"):
+    def __init__(self, name: str = "ML Test Suite", rng: Optional[np.random.Generator] = None):
         self.name = name
         self.test_results: List[TestResult] = []
         self.setup_complete = False
+        self._rng = _RNG if rng is None else rng  # One generator for every simulated draw
+        self._sys_req_result: Optional[bool] = None
         print(f"Initialized {name}")
     
-    def setup_test_environment(self):
+    def setup_test_environment(self, simulate_delay: float = 0.0):
         """Setup the testing environment with error handling"""
         try:
             print("Setting up test environment...")
-            # Simulate environment setup
-            time.sleep(0.1)  # Simulate setup time
+            # Optionally simulate slow environment setup (off by default so
+            # setup doesn't add to the total execution time)
+            if simulate_delay > 0:
+                time.sleep(simulate_delay)
             
             # Check system requirements
             if not self._check_system_requirements():
@@ -48,8 +79,15 @@ class MLTestFramework:
     
     def _check_system_requirements(self):
         """Simulate checking system requirements"""
-        # Simulate random system check failure
-        return random.random() > 0.1  # 90% success rate
+        # System requirements don't change during a run, so only check once
+        if self._sys_req_result is None:
+            # Simulate random system check failure
+            self._sys_req_result = self._rng.random() > 0.1  # 90% success rate
+        return self._sys_req_result
+    
+    def reset_env(self):
+        """Forget the cached system check so the next setup checks again"""
+        self._sys_req_result = None
     
     def run_test(self, test_name: str, test_function, *args, **kwargs):
         """Run a single test with comprehensive error handling"""
@@ -100,10 +138,49 @@ class MLTestFramework:
     
     def test_data_validation(self, data: List[List[float]]) -> Tuple[bool, str]:
         """Test data validation with edge cases"""
+        # Convert once without forcing a dtype: only all-number data becomes a
+        # numeric array, while text, None or ragged rows take the slow path
+        try:
+            arr = np.asarray(data)
+        except (TypeError, ValueError):
+            return self._locate_invalid_data(data)
+        if arr.dtype.kind not in 'biuf':
+            return self._locate_invalid_data(data)
+        
+        return self._validate_array(arr.astype(np.float64, copy=False))
+    
+    def _validate_array(self, arr: np.ndarray) -> Tuple[bool, str]:
+        """Run the validation checks on data already converted to a float array"""
         # Test 1: Empty data
-        if not data:
+        if arr.shape[0] == 0:
             return False, "Data is empty"
         
+        # Test 2: Minimum size
+        if arr.shape[0] < 2:
+            return False, f"Data too small: {arr.shape[0]} rows"
+        
+        # Test 3: Consistent dimensions (a float array is always rectangular)
+        if arr.ndim != 2:
+            return False, f"Expected rows of values, got {arr.ndim}D data"
+        
+        # Tests 4-5: a single max() reduction catches both problems, since NaN
+        # propagates through max (rows with no values have nothing to check)
+        if arr.size:
+            peak = np.abs(arr).max()
+            if np.isnan(peak) or peak > 1e6:
+                # Test 4: Valid values
+                nan_mask = np.isnan(arr)
+                if nan_mask.any():
+                    i, j = np.argwhere(nan_mask)[0]
+                    return False, f"Invalid value at row {i}, col {j}"
+                
+                # Test 5: Reasonable ranges
+                return False, "Values outside reasonable range"
+        
+        return True, f"Data validation passed: {arr.shape[0]} rows, {arr.shape[1]} columns"
+    
+    def _locate_invalid_data(self, data: List[List[float]]) -> Tuple[bool, str]:
+        """Check data that didn't convert to a numeric array one value at a time"""
         # Test 2: Minimum size
         if len(data) < 2:
             return False, f"Data too small: {len(data)} rows"
@@ -119,10 +196,11 @@ class MLTestFramework:
             for j, val in enumerate(row):
                 if val is None or (isinstance(val, float) and (val != val)):  # Check for NaN
                     return False, f"Invalid value at row {i}, col {j}"
+                if not isinstance(val, (int, float)):
+                    return False, f"Non-numeric value at row {i}, col {j}"
         
-        # Test 5: Reasonable ranges
-        flat_values = [val for row in data for val in row]
-        if any(abs(val) > 1e6 for val in flat_values):
+        # Test 5: Reasonable ranges (e.g. ints too big for a NumPy array)
+        if any(abs(val) > 1e6 for row in data for val in row):
             return False, "Values outside reasonable range"
         
         return True, f"Data validation passed: {len(data)} rows, {expected_cols} columns"
@@ -131,18 +209,20 @@ class MLTestFramework:
         """Test model training with various scenarios"""
         try:
             # Simulate model training
-            if not data or len(data) < 3:
+            arr = _as_array(data)
+            if arr.shape[0] < 3:
                 return False, "Insufficient data for training"
             
             # Simulate training process
-            weights = [random.uniform(-1, 1) for _ in range(len(data[0]))]
+            weights = self._rng.uniform(-1.0, 1.0, size=arr.shape[1])
+            largest_weight = np.abs(weights).max()
             
             # Test for training convergence
-            if all(abs(w) < 0.001 for w in weights):
+            if largest_weight < 0.001:
                 return False, "Model failed to converge (weights too small)"
             
             # Test for training stability
-            if any(abs(w) > 10 for w in weights):
+            if largest_weight > 10:
                 return False, "Model unstable (weights too large)"
             
             return True, f"Training successful with {len(weights)} weights"
@@ -150,46 +230,38 @@ class MLTestFramework:
         except Exception as e:
             return False, f"Training failed: {e}"
     
-    def test_edge_cases(self) -> Tuple[bool, str]:
+    @staticmethod
+    def _edge_cases():
+        """Yield each edge case lazily, so cases after a fail-fast stop are never built"""
+        yield "Empty list", []
+        yield "Single item", [[1.0]]
+        yield "All zeros", [[0, 0], [0, 0]]
+        yield "Large values", [[1e5, 1e5], [1e6, 1e6]]
+        yield "Negative values", [[-1, -2], [-3, -4]]
+        yield "Mixed signs", [[1, -1], [-1, 1]]
+    
+    def test_edge_cases(self, fail_fast: bool = False) -> Tuple[bool, str]:
         """Test various edge cases"""
-        edge_cases = [
-            ("Empty list", []),
-            ("Single item", [[1.0]]),
-            ("All zeros", [[0, 0], [0, 0]]),
-            ("Large values", [[1e5, 1e5], [1e6, 1e6]]),
-            ("Negative values", [[-1, -2], [-3, -4]]),
-            ("Mixed signs", [[1, -1], [-1, 1]]),
-        ]
-        
+        # Some edge cases are expected to fail validation
+        expected_failures = {"Empty list", "Single item"}
         failed_cases = []
+        case_count = 0
         
-        for case_name, test_data in edge_cases:
-            try:
-                # Test data validation
-                is_valid, msg = self.test_data_validation(test_data)
-                
-                # Some edge cases are expected to fail validation
-                expected_failures = ["Empty list", "Single item"]
-                if case_name in expected_failures and not is_valid:
-                    continue  # Expected failure
-                elif case_name not in expected_failures and not is_valid:
-                    failed_cases.append(f"{case_name}: {msg}")
-                    
-            except Exception as e:
-                failed_cases.append(f"{case_name}: Exception {e}")
+        for case_name, test_data in self._edge_cases():
+            case_count += 1
+            is_valid, msg = self.test_data_validation(test_data)
+            if not is_valid and case_name not in expected_failures:
+                failed_cases.append(f"{case_name}: {msg}")
+                if fail_fast:
+                    break
         
         if failed_cases:
             return False, f"Edge cases failed: {'; '.join(failed_cases)}"
         else:
-            return True, f"All {len(edge_cases)} edge cases handled correctly"
+            return True, f"All {case_count} edge cases handled correctly"
     
     def test_prediction_robustness(self, weights: List[float]) -> Tuple[bool, str]:
         """Test prediction function with various inputs"""
-        def predict(inputs, weights):
-            if len(inputs) != len(weights):
-                raise ValueError("Input-weight dimension mismatch")
-            return sum(x * w for x, w in zip(inputs, weights))
-        
         test_cases = [
             ("Normal case", [1.0, 2.0]),
             ("Zero input", [0.0, 0.0]),
@@ -198,20 +270,27 @@ class MLTestFramework:
             ("Small decimals", [0.001, 0.002]),
         ]
         
-        failed_tests = []
+        # Stack all inputs into one matrix so every prediction comes from a single product
+        X = _as_array([test_input for _, test_input in test_cases])
+        w = _as_array(weights)
         
-        for test_name, test_input in test_cases:
-            try:
-                result = predict(test_input, weights)
-                
-                # Check for reasonable output
-                if abs(result) > 1e10:
-                    failed_tests.append(f"{test_name}: result too large ({result})")
-                elif result != result:  # Check for NaN
+        if X.shape[1] != w.shape[0]:
+            failed_tests = [f"{test_name}: Input-weight dimension mismatch"
+                            for test_name, _ in test_cases]
+        else:
+            results = X @ w
+            
+            # Check for reasonable output
+            too_large = np.abs(results) > 1e10
+            is_nan = np.isnan(results)
+            
+            failed_tests = []
+            for i in np.flatnonzero(too_large | is_nan):
+                test_name = test_cases[i][0]
+                if too_large[i]:
+                    failed_tests.append(f"{test_name}: result too large ({results[i]})")
+                else:
                     failed_tests.append(f"{test_name}: result is NaN")
-                    
-            except Exception as e:
-                failed_tests.append(f"{test_name}: {e}")
         
         if failed_tests:
             return False, f"Prediction tests failed: {'; '.join(failed_tests)}"
@@ -220,9 +299,7 @@ class MLTestFramework:
     
     def run_comprehensive_test_suite(self):
         """Run the complete test suite"""
-        print(f"\n{'='*50}")
-        print(f"Running {self.name}")
-        print(f"{'='*50}")
+        print(f"\n{'='*50}\nRunning {self.name}\n{'='*50}")
         
         # Setup
         if not self.setup_test_environment():
@@ -232,7 +309,7 @@ class MLTestFramework:
         print()
         
         # Generate test data
-        test_data = [[random.uniform(0, 100), random.uniform(0, 100)] for _ in range(20)]
+        test_data = self._rng.uniform(0.0, 100.0, size=(20, 2))
         test_weights = [0.5, 0.3]
         
         # Run all tests
@@ -264,74 +341,77 @@ class MLTestFramework:
     
     def generate_test_report(self):
         """Generate a comprehensive test report"""
-        print(f"\n{'='*50}")
-        print("TEST REPORT")
-        print(f"{'='*50}")
+        # Collect every line first and print the whole report at once
+        lines = [f"\n{'='*50}", "TEST REPORT", f"{'='*50}"]
+        
+        # One pass over the results gathers the counts, total time and both listings
+        passed_tests = 0
+        total_time = 0.0
+        failed_lines = []
+        detail_lines = []
+        for result in self.test_results:
+            total_time += result.execution_time
+            if result.passed:
+                passed_tests += 1
+                status = "✓"
+            else:
+                failed_lines.append(f"  ✗ {result.name}: {result.message}")
+                status = "✗"
+            detail_lines.append(f"  {status} {result.name}: {result.message} ({result.execution_time:.3f}s)")
         
         total_tests = len(self.test_results)
-        passed_tests = sum(1 for result in self.test_results if result.passed)
         failed_tests = total_tests - passed_tests
         
-        print(f"Total Tests: {total_tests}")
-        print(f"Passed: {passed_tests}")
-        print(f"Failed: {failed_tests}")
-        print(f"Success Rate: {(passed_tests/total_tests)*100:.1f}%")
-        
-        total_time = sum(result.execution_time for result in self.test_results)
-        print(f"Total Execution Time: {total_time:.3f}s")
+        lines.append(f"Total Tests: {total_tests}")
+        lines.append(f"Passed: {passed_tests}")
+        lines.append(f"Failed: {failed_tests}")
+        lines.append(f"Success Rate: {(passed_tests/total_tests)*100:.1f}%")
+        lines.append(f"Total Execution Time: {total_time:.3f}s")
         
         if failed_tests > 0:
-            print(f"\nFAILED TESTS:")
-            for result in self.test_results:
-                if not result.passed:
-                    print(f"  ✗ {result.name}: {result.message}")
+            lines.append(f"\nFAILED TESTS:")
+            lines.extend(failed_lines)
         
-        print(f"\nDETAILED RESULTS:")
-        for result in self.test_results:
-            status = "✓" if result.passed else "✗"
-            print(f"  {status} {result.name}: {result.message} ({result.execution_time:.3f}s)")
+        lines.append(f"\nDETAILED RESULTS:")
+        lines.extend(detail_lines)
+        
+        print("\n".join(lines))
 
 # Advanced test scenarios that combine previous concepts
-def test_integration_scenario():
+def test_integration_scenario(rng: Optional[np.random.Generator] = None):
     """Test a complete integration scenario"""
+    rng = _RNG if rng is None else rng
     print("\n=== Integration Test Scenario ===")
     
     # Simulate a complete ML workflow
     try:
         # Step 1: Data loading with error handling
         print("Step 1: Loading data...")
-        data = []
-        for i in range(15):
-            # Simulate some data quality issues
-            if i == 5:
-                data.append([None, 10])  # Missing value
-            elif i == 10:
-                data.append([100, float('inf')])  # Invalid value
-            else:
-                data.append([random.uniform(0, 100), random.uniform(0, 100)])
+        values = rng.uniform(0, 100, size=(15, 2))
+        # Simulate some data quality issues (a float array stores missing values as NaN)
+        values[5] = [np.nan, 10]  # Missing value
+        values[10] = [100, np.inf]  # Invalid value
         
-        print(f"  Loaded {len(data)} raw data points")
+        print(f"  Loaded {len(values)} raw data points")
         
         # Step 2: Data cleaning
         print("Step 2: Cleaning data...")
-        clean_data = []
-        issues_found = 0
+        # Flag every cell once: NaN marks a missing value, infinity an invalid one
+        missing_mask = np.isnan(values)
+        invalid_mask = np.isinf(values)
         
-        for i, row in enumerate(data):
-            # Check for issues
-            has_issue = False
-            if any(val is None for val in row):
+        missing_rows = missing_mask.any(axis=1)
+        invalid_rows = invalid_mask.any(axis=1)
+        
+        # Only rows with issues need a Python-level loop for their warnings
+        for i in np.flatnonzero(missing_rows | invalid_rows):
+            if missing_rows[i]:
                 print(f"  Warning: Missing value at row {i}")
-                has_issue = True
-                issues_found += 1
-            
-            if any(isinstance(val, float) and (val == float('inf') or val != val) for val in row):
+            if invalid_rows[i]:
                 print(f"  Warning: Invalid value at row {i}")
-                has_issue = True
-                issues_found += 1
-            
-            if not has_issue:
-                clean_data.append(row)
+        
+        issues_found = int(missing_rows.sum() + invalid_rows.sum())
+        clean_data = values[~(missing_rows | invalid_rows)]
         
         print(f"  Cleaned data: {len(clean_data)} points, {issues_found} issues removed")
         
@@ -341,15 +421,15 @@ def test_integration_scenario():
             raise ValueError("Insufficient clean data for training")
         
         # Simulate training
-        weights = [random.uniform(-1, 1) for _ in range(len(clean_data[0]))]
-        print(f"  Model trained with weights: {[round(w, 3) for w in weights]}")
+        weights = rng.uniform(-1, 1, size=clean_data.shape[1])
+        print(f"  Model trained with weights: {np.round(weights, 3).tolist()}")
         
         # Step 4: Validation
         print("Step 4: Validating model...")
         test_inputs = [[25, 50], [75, 25], [0, 100]]
+        predictions = _as_array(test_inputs) @ weights
         
-        for i, test_input in enumerate(test_inputs):
-            prediction = sum(x * w for x, w in zip(test_input, weights))
+        for i, (test_input, prediction) in enumerate(zip(test_inputs, predictions)):
             print(f"  Test {i+1}: {test_input} -> {prediction:.2f}")
         
         print("✓ Integration test PASSED")
@@ -360,8 +440,9 @@ def test_integration_scenario():
         return False
 
 # Performance testing
-def test_performance_scenarios():
+def test_performance_scenarios(rng: Optional[np.random.Generator] = None):
     """Test performance under various conditions"""
+    rng = _RNG if rng is None else rng
     print("\n=== Performance Test Scenarios ===")
     
     scenarios = [
@@ -370,23 +451,22 @@ def test_performance_scenarios():
         ("Large dataset", 1000),
     ]
     
+    # Compile the kernel up front so JIT time isn't counted against the first scenario
+    _process_rows(np.zeros((1, 5)))
+    
     for scenario_name, size in scenarios:
         print(f"\nTesting {scenario_name} ({size} points):")
         
-        start_time = time.time()
+        # perf_counter has the resolution to time these short scenarios
+        start_time = time.perf_counter()
         
         # Generate data
-        data = [[random.uniform(0, 100) for _ in range(5)] for _ in range(size)]
+        data = rng.uniform(0.0, 100.0, size=(size, 5))
         
         # Simulate processing
-        processed = 0
-        for row in data:
-            # Simulate some computation
-            result = sum(val * 0.1 for val in row)
-            if result > 0:
-                processed += 1
-        
-        end_time = time.time()
+        processed = _process_rows(np.ascontiguousarray(data, dtype=np.float64))
+        
+        end_time = time.perf_counter()
         execution_time = end_time - start_time
         
         print(f"  Processed {processed}/{size} items in {execution_time:.3f}s")
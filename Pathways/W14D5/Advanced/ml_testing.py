@@ -3,25 +3,33 @@
 
 print("=== Advanced ML Testing and Debugging ===\n")
 
-import random
 import json
-from datetime import datetime
+import time
+import numpy as np
+
+# Seeded generator so the simulated failures and weights repeat between runs
+_RNG = np.random.default_rng(0)
 
 # Advanced logging for debugging
+class LogEntry:
+    """A single log record (slots keep each entry small)"""
+    __slots__ = ('time', 'level', 'message', 'data')
+    
+    def __init__(self, timestamp, level, message, data=None):
+        self.time = timestamp
+        self.level = level
+        self.message = message
+        self.data = data
+
 class MLLogger:
     """Simple logging class for ML debugging"""
     def __init__(self):
         self.logs = []
     
     def log(self, level, message, data=None):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = {
-            "time": timestamp,
-            "level": level,
-            "message": message,
-            "data": data
-        }
-        self.logs.append(log_entry)
+        # time.strftime formats the clock directly, without building a datetime object
+        timestamp = time.strftime("%H:%M:%S", time.localtime())
+        self.logs.append(LogEntry(timestamp, level, message, data))
         print(f"[{timestamp}] {level}: {message}")
         if data:
             print(f"  Data: {data}")
@@ -36,11 +44,13 @@ logger = MLLogger()
 class SimpleMLPipeline:
     """A simple ML pipeline with advanced error handling"""
     
-    def __init__(self, name="ML Pipeline"):
+    def __init__(self, name="ML Pipeline", rng=None):
         self.name = name
+        self._rng = _RNG if rng is None else rng  # One generator for every simulated draw
         self.data = None
         self.model_trained = False
         self.weights = None
+        self.weights_np = None  # float64 copy of the weights used for predictions
         logger.log("INFO", f"Initialized {name}")
     
     def load_and_validate_data(self, data_source):
@@ -51,11 +61,10 @@ class SimpleMLPipeline:
             # Simulate different data sources
             if data_source == "database":
                 # Simulate database connection issues
-                if random.random() < 0.3:  # 30% chance of failure
+                if self._rng.random() < 0.3:  # 30% chance of failure
                     raise ConnectionError("Database connection failed")
                 
-                self.data = [[random.randint(1, 100), random.randint(1, 100)] 
-                           for _ in range(50)]
+                self.data = self._rng.integers(1, 101, size=(50, 2)).tolist()
             
             elif data_source == "file":
                 # Simulate file reading
@@ -98,8 +107,8 @@ class SimpleMLPipeline:
             if len(row) != expected_features:
                 raise ValueError(f"Inconsistent features at row {i}")
             
-            # Check for missing values (None or empty)
-            if any(val is None or val == "" for val in row):
+            # Check for missing values (None or empty) with C-level membership tests
+            if None in row or "" in row:
                 logger.log("WARNING", f"Missing values found at row {i}")
         
         logger.log("INFO", "Data validation passed")
@@ -121,22 +130,28 @@ class SimpleMLPipeline:
             
             # Simulate training process with monitoring
             feature_count = len(self.data[0])
-            self.weights = [random.uniform(-1, 1) for _ in range(feature_count)]
+            self.weights = self._rng.uniform(-1, 1, size=feature_count)
+            
+            # Simulate training iterations with progress monitoring: draw every
+            # iteration's instability roll at once, then only visit iterations that log
+            draws = self._rng.random(max_iterations)
+            unstable_iters = np.flatnonzero(draws < 0.02)  # 2% chance of instability
+            log_iters = np.arange(0, max_iterations, 20)  # Log every 20 iterations
+            
+            # Reduce the learning rate once per unstable iteration
+            learning_rate *= 0.9 ** len(unstable_iters)
             
-            # Simulate training iterations with progress monitoring
-            for iteration in range(max_iterations):
-                # Simulate training step
-                if iteration % 20 == 0:  # Log every 20 iterations
+            for iteration in np.union1d(log_iters, unstable_iters):
+                if iteration % 20 == 0:
                     simulated_loss = 1.0 / (1 + iteration * 0.1)
                     logger.log("DEBUG", f"Iteration {iteration}, Loss: {simulated_loss:.3f}")
                 
-                # Simulate training instability
-                if random.random() < 0.02:  # 2% chance of instability
+                if draws[iteration] < 0.02:
                     logger.log("WARNING", f"Training instability detected at iteration {iteration}")
-                    learning_rate *= 0.9  # Reduce learning rate
             
+            self.weights_np = np.asarray(self.weights, dtype=np.float64)
             self.model_trained = True
-            logger.log("SUCCESS", f"Model trained successfully with weights: {[round(w, 3) for w in self.weights]}")
+            logger.log("SUCCESS", f"Model trained successfully with weights: {np.round(self.weights, 3).tolist()}")
             return True
             
         except ValueError as e:
@@ -164,10 +179,10 @@ class SimpleMLPipeline:
                 raise ValueError(f"Input size {len(input_data)} doesn't match model {len(self.weights)}")
             
             # Make prediction
-            prediction = sum(x * w for x, w in zip(input_data, self.weights))
+            prediction = float(np.dot(np.asarray(input_data, dtype=np.float64), self.weights_np))
             
             # Simulate confidence calculation
-            confidence = min(0.95, random.uniform(0.6, 1.0))
+            confidence = min(0.95, self._rng.uniform(0.6, 1.0))
             
             # Check confidence threshold
             if confidence < confidence_threshold:
@@ -233,4 +248,4 @@ if __name__ == "__main__":
     # Show all logs
     print(f"\n=== Debug Logs ({len(logger.get_logs())} entries) ===")
     for log in logger.get_logs()[-10:]:  # Show last 10 logs
-        print(f"{log['time']} [{log['level']}] {log['message']}")
\ No newline at end of file
+        print(f"{log.time} [{log.level}] {log.message}")
\ No newline at end of file
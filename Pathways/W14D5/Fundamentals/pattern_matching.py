@@ -3,20 +3,48 @@ Library Management System
 A system to manage books, members, and borrowing records.
 """
 
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
+import bisect
+import functools
 import json
+import sys
+import time
+
+# orjson is optional; it encodes (including datetimes) in C, json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _remove_one(counter: Counter, key: str) -> None:
+    """Drop one occurrence of key, deleting it once none are left."""
+    counter[key] -= 1
+    if not counter[key]:
+        del counter[key]
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Every 3-character substring of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
 
 
 class Book:
     def __init__(self, isbn: str, title: str, author: str, genre: str, copies: int = 1):
-        self.isbn = isbn
+        # Interned so every reference to this ISBN shares one string object
+        self.isbn = sys.intern(isbn)
         self.title = title
         self.author = author
         self.genre = genre
+        # Lowercased once here so searches don't case-fold every book per query
+        self._title_lower = title.lower()
+        self._author_lower = author.lower()
         self.total_copies = copies
         self.available_copies = copies
-        self.borrowed_by: List[str] = []
+        # Member ID -> copies held (a member may borrow several copies)
+        self.borrowed_by: Counter = Counter()
 
     def __str__(self) -> str:
         return f"{self.title} by {self.author} (ISBN: {self.isbn})"
@@ -27,16 +55,17 @@ class Book:
 
 class Member:
     def __init__(self, member_id: str, name: str, email: str, phone: str):
-        self.member_id = member_id
+        self.member_id = sys.intern(member_id)
         self.name = name
         self.email = email
         self.phone = phone
-        self.borrowed_books: List[str] = []
+        # ISBN -> copies held, for O(1) membership checks and removal
+        self.borrowed_books: Counter = Counter()
         self.borrowing_history: List[Dict] = []
         self.membership_start = datetime.now()
 
     def can_borrow(self, max_books: int = 5) -> bool:
-        return len(self.borrowed_books) < max_books
+        return sum(self.borrowed_books.values()) < max_books
 
     def __str__(self) -> str:
         return f"Member {self.name} (ID: {self.member_id})"
@@ -48,9 +77,35 @@ class Library:
         self.books: Dict[str, Book] = {}
         self.members: Dict[str, Member] = {}
         self.borrowing_records: List[Dict] = []
+        # Open (not yet returned) records by (member_id, isbn), oldest first
+        self._open_records: Dict[Tuple[str, str], List[Dict]] = {}
+        # Loans sorted by due_ts (kept as parallel lists for bisect). Every loan
+        # is due 14 days after it starts, so new loans almost always go at the
+        # end; returned loans are trimmed from the front lazily
+        self._due_ts: List[int] = []
+        self._due_records: List[Dict] = []
+        # Recent search results (as ISBNs), cleared whenever the catalog changes
+        self._search_cached = functools.lru_cache(maxsize=128)(self._search_isbns)
+        # Inverted index from title/author trigrams to ISBNs, plus each ISBN's
+        # catalog position so indexed results keep the catalog order
+        self._index: Dict[str, Set[str]] = defaultdict(set)
+        self._catalog_pos: Dict[str, int] = {}
+        # Saved form of each book/member; only entries changed since the last
+        # save are rebuilt by save_to_file (dirty keys are kept in a dict, which
+        # unlike a set remembers insertion order, so files list the catalog in order)
+        self._book_rows: Dict[str, Dict] = {}
+        self._member_rows: Dict[str, Dict] = {}
+        self._dirty_books: Dict[str, None] = {}
+        self._dirty_members: Dict[str, None] = {}
+        # Running totals for generate_report
+        self._total_copies = 0
+        self._total_borrowed = 0
 
     def add_book(self, book: Book) -> bool:
         """Add a book to the library catalog."""
+        self._search_cached.cache_clear()
+        self._dirty_books[book.isbn] = None
+        self._total_copies += book.total_copies
         if book.isbn in self.books:
             # Book already exists, increase copies
             self.books[book.isbn].total_copies += book.total_copies
@@ -58,6 +113,9 @@ class Library:
             return True
         else:
             self.books[book.isbn] = book
+            self._catalog_pos[book.isbn] = len(self._catalog_pos)
+            for gram in _trigrams(book._title_lower) | _trigrams(book._author_lower):
+                self._index[gram].add(book.isbn)
             return True
 
     def register_member(self, member: Member) -> bool:
@@ -65,10 +123,13 @@ class Library:
         if member.member_id in self.members:
             return False
         self.members[member.member_id] = member
+        self._dirty_members[member.member_id] = None
         return True
 
     def borrow_book(self, member_id: str, isbn: str) -> Optional[str]:
         """Process a book borrowing request."""
+        member_id = sys.intern(member_id)
+        isbn = sys.intern(isbn)
         if member_id not in self.members:
             return "Member not found"
         
@@ -86,25 +147,38 @@ class Library:
         
         # Process the borrowing
         book.available_copies -= 1
-        book.borrowed_by.append(member_id)
-        member.borrowed_books.append(isbn)
+        book.borrowed_by[member_id] += 1
+        member.borrowed_books[isbn] += 1
         
-        # Record the transaction
+        # Record the transaction (one clock read, so due_date is exactly 14 days on)
+        now = datetime.now()
         borrowing_record = {
             'member_id': member_id,
             'isbn': isbn,
-            'borrow_date': datetime.now(),
-            'due_date': datetime.now() + timedelta(days=14),
+            'borrow_date': now,
+            'due_date': now + timedelta(days=14),
             'returned': False
         }
+        # Due date as epoch seconds, so overdue checks compare plain ints
+        borrowing_record['due_ts'] = int(borrowing_record['due_date'].timestamp())
         
         self.borrowing_records.append(borrowing_record)
         member.borrowing_history.append(borrowing_record)
+        self._open_records.setdefault((member_id, isbn), []).append(borrowing_record)
+        pos = bisect.bisect_right(self._due_ts, borrowing_record['due_ts'])
+        self._due_ts.insert(pos, borrowing_record['due_ts'])
+        self._due_records.insert(pos, borrowing_record)
+        
+        self._dirty_books[isbn] = None
+        self._dirty_members[member_id] = None
+        self._total_borrowed += 1
         
         return None  # Success
 
     def return_book(self, member_id: str, isbn: str) -> Optional[str]:
         """Process a book return."""
+        member_id = sys.intern(member_id)
+        isbn = sys.intern(isbn)
         if member_id not in self.members:
             return "Member not found"
         
@@ -119,47 +193,64 @@ class Library:
         
         # Process the return
         book.available_copies += 1
-        book.borrowed_by.remove(member_id)
-        member.borrowed_books.remove(isbn)
-        
-        # Update borrowing record
-        for record in self.borrowing_records:
-            if (record['member_id'] == member_id and 
-                record['isbn'] == isbn and 
-                not record['returned']):
-                record['returned'] = True
-                record['return_date'] = datetime.now()
-                break
+        _remove_one(book.borrowed_by, member_id)
+        _remove_one(member.borrowed_books, isbn)
+        
+        # Update borrowing record (the oldest open one, looked up by key)
+        open_records = self._open_records.get((member_id, isbn))
+        if open_records:
+            record = open_records.pop(0)
+            if not open_records:
+                del self._open_records[(member_id, isbn)]
+            record['returned'] = True
+            record['return_date'] = datetime.now()
+        
+        self._dirty_books[isbn] = None
+        self._dirty_members[member_id] = None
+        self._total_borrowed -= 1
         
         return None  # Success
 
     def get_overdue_books(self) -> List[Dict]:
         """Get list of overdue books."""
-        overdue = []
-        current_date = datetime.now()
+        now_ts = int(time.time())
         
-        for record in self.borrowing_records:
-            if not record['returned'] and record['due_date'] < current_date:
-                overdue.append(record)
+        # Drop loans at the front that were already returned
+        start = 0
+        while start < len(self._due_records) and self._due_records[start]['returned']:
+            start += 1
+        if start:
+            del self._due_ts[:start]
+            del self._due_records[:start]
         
-        return overdue
+        # Everything before the cut-off is past due; later loans are never visited
+        cutoff = bisect.bisect_left(self._due_ts, now_ts)
+        return [record for record in self._due_records[:cutoff] if not record['returned']]
 
     def search_books(self, query: str) -> List[Book]:
         """Search for books by title or author."""
-        results = []
-        query_lower = query.lower()
-        
-        for book in self.books.values():
-            if (query_lower in book.title.lower() or 
-                query_lower in book.author.lower()):
-                results.append(book)
+        return [self.books[isbn] for isbn in self._search_cached(query.lower())]
+
+    def _search_isbns(self, query_lower: str) -> Tuple[str, ...]:
+        """Find the ISBNs of books whose title or author contains the query."""
+        if len(query_lower) < 3:
+            # Too short to have a trigram, so check every book
+            candidates = self.books
+        else:
+            postings = [self._index.get(gram) for gram in _trigrams(query_lower)]
+            if not all(postings):
+                return ()
+            candidates = sorted(set.intersection(*postings), key=self._catalog_pos.get)
         
-        return results
+        # Trigrams can match across title and author, so confirm each candidate
+        return tuple(isbn for isbn in candidates
+                     if query_lower in self.books[isbn]._title_lower
+                     or query_lower in self.books[isbn]._author_lower)
 
     def generate_report(self) -> Dict:
         """Generate a library usage report."""
-        total_books = sum(book.total_copies for book in self.books.values())
-        total_borrowed = sum(len(book.borrowed_by) for book in self.books.values())
+        total_books = self._total_copies
+        total_borrowed = self._total_borrowed
         total_members = len(self.members)
         
         overdue_count = len(self.get_overdue_books())
@@ -175,25 +266,43 @@ class Library:
     def save_to_file(self, filename: str) -> bool:
         """Save library data to JSON file."""
         try:
-            data = {
-                'name': self.name,
-                'books': {isbn: {
+            # Rebuild only the books and members that changed since the last save
+            for isbn in self._dirty_books:
+                book = self.books[isbn]
+                self._book_rows[isbn] = {
                     'title': book.title,
                     'author': book.author,
                     'genre': book.genre,
                     'total_copies': book.total_copies,
                     'available_copies': book.available_copies
-                } for isbn, book in self.books.items()},
-                'members': {mid: {
+                }
+            for mid in self._dirty_members:
+                member = self.members[mid]
+                self._member_rows[mid] = {
                     'name': member.name,
                     'email': member.email,
                     'phone': member.phone,
-                    'borrowed_books': member.borrowed_books
-                } for mid, member in self.members.items()}
-            }
+                    # Open loans in the order they were borrowed (the Counter
+                    # would group copies of the same ISBN together)
+                    'borrowed_books': [record['isbn'] for record in member.borrowing_history
+                                       if not record['returned']]
+                }
+            self._dirty_books.clear()
+            self._dirty_members.clear()
             
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            if orjson is not None:
+                with open(filename, 'wb') as f:
+                    f.writelines(self._iter_json_chunks())
+            else:
+                # Every value is already a str/int/list, so no default= fallback is
+                # needed; json.dump already writes the file piece by piece
+                data = {
+                    'name': self.name,
+                    'books': self._book_rows,
+                    'members': self._member_rows
+                }
+                with open(filename, 'w') as f:
+                    json.dump(data, f, indent=2)
             
             return True
         except Exception as e:
@@ -201,6 +310,35 @@ class Library:
             return False
 
 
+    def _iter_json_chunks(self):
+        """Yield the saved JSON one entry at a time, laid out like json.dump(indent=2)."""
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC
+
+        def dumps(value) -> bytes:
+            encoded = orjson.dumps(value, option=option)
+            # orjson writes non-ASCII text as raw UTF-8, json.dump as \uXXXX escapes
+            return encoded if encoded.isascii() else json.dumps(value, indent=2).encode()
+
+        yield b'{\n  "name": ' + dumps(self.name) + b',\n'
+        
+        sections = (('books', self._book_rows), ('members', self._member_rows))
+        for section_num, (section, rows) in enumerate(sections):
+            if not rows:
+                yield b'  "' + section.encode() + b'": {}'
+            else:
+                yield b'  "' + section.encode() + b'": {\n'
+                for row_num, (key, row) in enumerate(rows.items()):
+                    if row_num:
+                        yield b',\n'
+                    # Each row is encoded alone, then indented to sit two levels deep
+                    yield (b'    ' + dumps(key) + b': '
+                           + dumps(row).replace(b'\n', b'\n    '))
+                yield b'\n  }'
+            yield b',\n' if section_num < len(sections) - 1 else b'\n'
+        
+        yield b'}'
+
+
 def main():
     """Example usage of the library system."""
     # Create library
@@ -6,7 +6,10 @@ lon = -74.0060  # New York City longitude
 
 url = f"https://api.openweathermap.org/data/2.5/forecast?lat={lat}&lon={lon}&appid={api_key}&units=metric"
 
-response = requests.get(url)
+# Reuse one pooled, keep-alive connection for every request made by this script
+session = requests.Session()
+
+response = session.get(url, timeout=10)
 data = response.json()
 
 print(f"5-day forecast for coordinates ({lat}, {lon}):")
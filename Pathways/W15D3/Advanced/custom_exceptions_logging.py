@@ -1,7 +1,9 @@
 # File 5: Advanced - Custom Exceptions and Logging
 # Creating custom exceptions and implementing error logging
 
+import functools
 import logging
+import re
 from datetime import datetime
 
 print("=== Custom Exceptions and Error Logging ===\n")
@@ -16,6 +18,11 @@ logging.basicConfig(
     ]
 )
 
+# Loggers are looked up once here instead of on every object or call
+_GRADE_LOGGER = logging.getLogger('GradeManager')
+_BANK_LOGGER = logging.getLogger('BankAccount')
+_EMAIL_LOGGER = logging.getLogger('EmailValidator')
+
 # Custom Exception Classes
 class StudentGradeError(Exception):
     """Custom exception for student grade validation"""
@@ -41,7 +48,9 @@ class GradeManager:
     
     def __init__(self):
         self.students = {}
-        self.logger = logging.getLogger('GradeManager')
+        # Running totals per student, so averages don't re-sum every grade
+        self._sum = {}
+        self._count = {}
     
     def add_grade(self, student_name, grade):
         """Add a grade for a student with validation"""
@@ -53,7 +62,7 @@ class GradeManager:
                     grade
                 )
             
-            if grade < 0 or grade > 100:
+            if not 0 <= grade <= 100:
                 raise StudentGradeError(
                     f"Grade must be between 0 and 100, got {grade}",
                     grade
@@ -64,21 +73,24 @@ class GradeManager:
                 self.students[student_name] = []
             
             self.students[student_name].append(grade)
-            self.logger.info(f"Added grade {grade} for {student_name}")
+            self._sum[student_name] = self._sum.get(student_name, 0) + grade
+            self._count[student_name] = self._count.get(student_name, 0) + 1
+            if _GRADE_LOGGER.isEnabledFor(logging.INFO):
+                _GRADE_LOGGER.info(f"Added grade {grade} for {student_name}")
             print(f"Successfully added grade {grade} for {student_name}")
             
         except StudentGradeError as e:
             error_msg = f"Grade Error for {student_name}: {e}"
-            self.logger.error(error_msg)
+            _GRADE_LOGGER.error(error_msg)
             print(error_msg)
             
             # Log additional details if available
             if hasattr(e, 'grade_value') and e.grade_value is not None:
-                self.logger.error(f"Invalid grade value: {e.grade_value}")
+                _GRADE_LOGGER.error(f"Invalid grade value: {e.grade_value}")
         
         except Exception as e:
             error_msg = f"Unexpected error adding grade for {student_name}: {e}"
-            self.logger.critical(error_msg)
+            _GRADE_LOGGER.critical(error_msg)
             print(error_msg)
     
     def get_average(self, student_name):
@@ -87,16 +99,16 @@ class GradeManager:
             if student_name not in self.students:
                 raise StudentGradeError(f"Student {student_name} not found")
             
-            grades = self.students[student_name]
-            if not grades:
+            if not self._count.get(student_name):
                 raise StudentGradeError(f"No grades found for {student_name}")
             
-            average = sum(grades) / len(grades)
-            self.logger.info(f"Calculated average for {student_name}: {average:.2f}")
+            average = self._sum[student_name] / self._count[student_name]
+            if _GRADE_LOGGER.isEnabledFor(logging.INFO):
+                _GRADE_LOGGER.info(f"Calculated average for {student_name}: {average:.2f}")
             return average
             
         except StudentGradeError as e:
-            self.logger.warning(f"Grade calculation error: {e}")
+            _GRADE_LOGGER.warning(f"Grade calculation error: {e}")
             print(f"Error: {e}")
             return None
 
@@ -107,9 +119,9 @@ class BankAccount:
     def __init__(self, account_holder, initial_balance=0):
         self.account_holder = account_holder
         self.balance = initial_balance
-        self.logger = logging.getLogger('BankAccount')
         
-        self.logger.info(f"Account created for {account_holder} with balance ${initial_balance}")
+        if _BANK_LOGGER.isEnabledFor(logging.INFO):
+            _BANK_LOGGER.info(f"Account created for {account_holder} with balance ${initial_balance}")
     
     def withdraw(self, amount):
         """Withdraw money with custom exception handling"""
@@ -125,63 +137,86 @@ class BankAccount:
                 )
             
             self.balance -= amount
-            self.logger.info(f"{self.account_holder} withdrew ${amount}. New balance: ${self.balance}")
+            if _BANK_LOGGER.isEnabledFor(logging.INFO):
+                _BANK_LOGGER.info(f"{self.account_holder} withdrew ${amount}. New balance: ${self.balance}")
             print(f"Withdrawal successful. New balance: ${self.balance}")
             
         except InsufficientFundsError as e:
             error_msg = f"Transaction failed: {e}"
-            self.logger.warning(error_msg)
+            _BANK_LOGGER.warning(error_msg)
             print(error_msg)
             print(f"Available balance: ${e.current_balance}")
             
         except ValueError as e:
             error_msg = f"Invalid withdrawal amount: {e}"
-            self.logger.error(error_msg)
+            _BANK_LOGGER.error(error_msg)
             print(error_msg)
         
         except Exception as e:
             error_msg = f"Unexpected error during withdrawal: {e}"
-            self.logger.critical(error_msg)
+            _BANK_LOGGER.critical(error_msg)
             print(error_msg)
 
 # Email Validation System
+# Compiled once: one @, a non-empty username, and a dotted domain, with no spaces
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+\Z')
+
+@functools.lru_cache(maxsize=4096)
+def _validate_email_pure(email):
+    """Check an email string, returning (is_valid, reason it failed or None)"""
+    if not email:
+        return False, "Email cannot be empty or non-string"
+    
+    email = email.strip()
+    
+    # A single regex match accepts well-formed emails; the checks below
+    # only run to explain why a malformed one was rejected
+    if _EMAIL_RE.match(email):
+        return True, None
+    
+    if '@' not in email:
+        return False, "Email must contain @ symbol"
+    
+    if email.count('@') != 1:
+        return False, "Email must contain exactly one @"
+    
+    username, domain = email.split('@')
+    
+    if not username or not domain:
+        return False, "Email must have both username and domain"
+    
+    if '.' not in domain:
+        return False, "Domain must contain at least one dot"
+    
+    return False, "Malformed email"
+
 def validate_email(email):
     """Validate email with custom exceptions and logging"""
-    logger = logging.getLogger('EmailValidator')
-    
     try:
-        if not email or not isinstance(email, str):
-            raise InvalidEmailError("Email cannot be empty or non-string")
-        
-        email = email.strip()
-        
-        if '@' not in email:
-            raise InvalidEmailError("Email must contain @ symbol")
+        # Non-strings are checked as "" so the cache key is always a string
+        if not isinstance(email, str):
+            email = ""
         
-        if email.count('@') != 1:
-            raise InvalidEmailError("Email must contain exactly one @")
+        # Repeated emails are answered from the cache
+        is_valid, reason = _validate_email_pure(email)
+        if not is_valid:
+            raise InvalidEmailError(reason)
         
-        username, domain = email.split('@')
-        
-        if not username or not domain:
-            raise InvalidEmailError("Email must have both username and domain")
-        
-        if '.' not in domain:
-            raise InvalidEmailError("Domain must contain at least one dot")
-        
-        logger.info(f"Email validation successful: {email}")
+        email = email.strip()
+        if _EMAIL_LOGGER.isEnabledFor(logging.INFO):
+            _EMAIL_LOGGER.info(f"Email validation successful: {email}")
         print(f"Valid email: {email}")
         return True
         
     except InvalidEmailError as e:
         error_msg = f"Email validation failed: {e}"
-        logger.warning(error_msg)
+        _EMAIL_LOGGER.warning(error_msg)
         print(error_msg)
         return False
     
     except Exception as e:
         error_msg = f"Unexpected error validating email: {e}"
-        logger.error(error_msg)
+        _EMAIL_LOGGER.error(error_msg)
         print(error_msg)
         return False
 
@@ -10,29 +10,39 @@ class InputValidator:
     def get_integer_input(prompt, min_value=None, max_value=None):
         """Get valid integer input from user with optional range checking"""
         while True:
-            try:
-                user_input = input(prompt)
-                number = int(user_input)
-                
-                # Range validation
-                if min_value is not None and number < min_value:
-                    raise ValueError(f"Number must be at least {min_value}")
-                
-                if max_value is not None and number > max_value:
-                    raise ValueError(f"Number must be no more than {max_value}")
-                
-                return number
-                
-            except ValueError as e:
-                if "invalid literal" in str(e):
-                    print("Error: Please enter a valid integer")
-                else:
-                    print(f"Error: {e}")
+            user_input = input(prompt).strip()
+            
+            # Check the text is an integer before converting, rather than
+            # raising and catching a ValueError for every bad attempt
+            digits = user_input[1:] if user_input[:1] in ('-', '+') else user_input
+            if not digits.isdecimal():
+                print("Error: Please enter a valid integer")
                 print("Please try again.\n")
+                continue
+            
+            number = int(user_input)
+            
+            # Range validation
+            if min_value is not None and number < min_value:
+                print(f"Error: Number must be at least {min_value}")
+                print("Please try again.\n")
+                continue
+            
+            if max_value is not None and number > max_value:
+                print(f"Error: Number must be no more than {max_value}")
+                print("Please try again.\n")
+                continue
+            
+            return number
     
     @staticmethod
     def get_choice_input(prompt, valid_choices):
         """Get user choice from a list of valid options"""
+        # The choices never change between attempts, so build the lookup set
+        # and the help message once
+        valid_set = frozenset(str(c).lower() for c in valid_choices)
+        choices_display = ', '.join(map(str, valid_choices))
+        
         while True:
             try:
                 choice = input(prompt).strip().lower()
@@ -40,8 +50,8 @@ class InputValidator:
                 if not choice:
                     raise ValueError("Input cannot be empty")
                 
-                if choice not in [str(c).lower() for c in valid_choices]:
-                    raise ValueError(f"Please choose from: {', '.join(map(str, valid_choices))}")
+                if choice not in valid_set:
+                    raise ValueError(f"Please choose from: {choices_display}")
                 
                 return choice
                 
@@ -39,7 +39,7 @@ print()
 print("Example 4: Program continues after handling error")
 print("Processing items...")
 
-items = [1, 2, "three", 4]
+items = [1, 2, None, 4]  # None * 2 raises a TypeError
 for item in items:
     try:
         doubled = item * 2
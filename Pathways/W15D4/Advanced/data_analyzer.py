@@ -2,8 +2,54 @@
 # This combines all optimization techniques into a practical program
 
 import time
-import random
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+from dataclasses import dataclass
+from operator import itemgetter
+
+import numpy as np
+
+# Numba is optional; without it the averages come from NumPy's bincount instead
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Every grade as parallel arrays (structure of arrays), sorted by student ID
+GradeTable = namedtuple('GradeTable', ['student_id', 'subject', 'grade', 'name_by_id'])
+
+# The fixed subject list, each with a small integer ID used by the fast methods
+SUBJECTS = ("Math", "Science", "English", "History", "Art")
+SUBJECT_IDS = {subject: i for i, subject in enumerate(SUBJECTS)}
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _student_averages(grades, subjects, offsets, subject_id):
+        """Every student's average (subject_id -1 means all subjects), students run in parallel"""
+        num_rows = offsets.shape[0] - 1
+        averages = np.zeros(num_rows)
+        for row in prange(num_rows):
+            total = 0.0
+            count = 0
+            for j in range(offsets[row], offsets[row + 1]):
+                if subject_id == -1 or subjects[j] == subject_id:
+                    total += grades[j]
+                    count += 1
+            if count > 0:
+                averages[row] = total / count
+        return averages
+
+# Slotted records use far less memory per grade than one dict each
+@dataclass(slots=True)
+class Grade:
+    subject: str
+    grade: int
+    assignment: str
+
+@dataclass(slots=True)
+class Student:
+    id: int
+    name: str
+    grades: list
 
 class StudentGradeAnalyzer:
     """
@@ -14,35 +60,47 @@ class StudentGradeAnalyzer:
     def __init__(self):
         # Use efficient data structures from the start
         self.grade_cache = {}
+        self._avg_cache = {}  # Student ID -> overall average, filled on first request
         self.student_lookup = {}  # Dictionary for fast student lookups
         self.subject_sets = defaultdict(set)  # Sets for fast membership testing
+        # Every grade as flat arrays for vectorized and compiled loops; a student's
+        # grades are the slice student_offsets[row]:student_offsets[row + 1]
+        self.subject_ids = dict(SUBJECT_IDS)
+        self.grade_table = GradeTable(np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int8),
+                                      np.empty(0, dtype=np.int16), {})
+        self.student_offsets = np.zeros(1, dtype=np.int64)
+        self._student_row = {}
+        self._row_ids = np.empty(0, dtype=np.int32)  # Student ID of each row
+        self._grade_row = np.empty(0, dtype=np.int64)  # Row of each grade
+        self._lookup_pos = np.empty(0, dtype=np.int64)  # Each row's position in student_lookup
         
     def generate_sample_data(self, num_students=1000, num_grades_per_student=10):
         """Generate sample student data for testing"""
         print(f"Generating sample data for {num_students} students...")
         
-        subjects = ["Math", "Science", "English", "History", "Art"]
+        subjects = SUBJECTS  # Every grade shares these same string objects
         students = []
         
+        # Draw every grade and subject in two NumPy calls instead of one
+        # random call per grade
+        rng = np.random.default_rng()
+        total_grades = num_students * num_grades_per_student
+        grade_values = rng.integers(60, 101, size=total_grades, dtype=np.int16).tolist()
+        subject_picks = rng.integers(0, len(subjects), size=total_grades, dtype=np.int8).tolist()
+        assignments = [f"Assignment_{i}" for i in range(num_grades_per_student)]
+        
         # Use list comprehension for faster data generation
         for student_id in range(num_students):
             student_name = f"Student_{student_id:04d}"
+            offset = student_id * num_grades_per_student
             
             # Generate grades efficiently
             student_grades = [
-                {
-                    'subject': random.choice(subjects),
-                    'grade': random.randint(60, 100),
-                    'assignment': f"Assignment_{i}"
-                }
+                Grade(subjects[subject_picks[offset + i]], grade_values[offset + i], assignments[i])
                 for i in range(num_grades_per_student)
             ]
             
-            students.append({
-                'id': student_id,
-                'name': student_name,
-                'grades': student_grades
-            })
+            students.append(Student(student_id, student_name, student_grades))
         
         return students
     
@@ -51,23 +109,62 @@ class StudentGradeAnalyzer:
         print("Building efficient data indexes...")
         
         # Clear previous indexes
+        self.grade_cache.clear()
+        self._avg_cache.clear()
         self.student_lookup.clear()
-        self.subject_sets.clear()
+        self.subject_sets = defaultdict(set)
+        
+        # Known subjects keep their fixed IDs; any others get the next free one
+        self.subject_ids = dict(SUBJECT_IDS)
+        grade_students = []
+        grade_values = []
+        grade_subjects = []
         
         # Build student lookup dictionary (O(1) access instead of O(n) searching)
         for student in students:
-            self.student_lookup[student['id']] = student
+            self.student_lookup[student.id] = student
             
             # Also build subject sets for each student
-            for grade in student['grades']:
-                self.subject_sets[student['id']].add(grade['subject'])
+            for grade in student.grades:
+                self.subject_sets[student.id].add(grade.subject)
+                grade_students.append(student.id)
+                grade_values.append(grade.grade)
+                grade_subjects.append(self.subject_ids.setdefault(grade.subject, len(self.subject_ids)))
+        
+        # The subject sets never change after this, so freeze them
+        self.subject_sets = {sid: frozenset(subjects) for sid, subjects in self.subject_sets.items()}
+        
+        # Contiguous copies of every grade, grouped by student
+        student_id = np.array(grade_students, dtype=np.int32)
+        order = np.argsort(student_id, kind='stable')
+        self.grade_table = GradeTable(
+            student_id=student_id[order],
+            subject=np.array(grade_subjects, dtype=np.int8)[order],
+            grade=np.array(grade_values, dtype=np.int16)[order],
+            name_by_id={student.id: student.name for student in students},
+        )
+        
+        # Where each student's slice starts (plus a final end offset)
+        row_ids = np.array(sorted(self.student_lookup), dtype=np.int32)
+        self._student_row = {int(sid): row for row, sid in enumerate(row_ids)}
+        self.student_offsets = np.append(
+            np.searchsorted(self.grade_table.student_id, row_ids), len(student_id))
+        self._row_ids = row_ids
+        self._grade_row = np.repeat(np.arange(len(row_ids)), np.diff(self.student_offsets))
+        lookup_pos = {sid: pos for pos, sid in enumerate(self.student_lookup)}
+        self._lookup_pos = np.array([lookup_pos[int(sid)] for sid in row_ids], dtype=np.int64)
+        
+        # Compile the kernel now so the first search isn't timed with the compile
+        if njit is not None:
+            _student_averages(self.grade_table.grade[:0], self.grade_table.subject[:0],
+                              self.student_offsets[:1], -1)
     
     def calculate_student_average_slow(self, student_id, students):
         """Slow way - search through all students every time"""
         # Bad: Linear search through all students
         student = None
         for s in students:
-            if s['id'] == student_id:
+            if s.id == student_id:
                 student = s
                 break
         
@@ -76,23 +173,27 @@ class StudentGradeAnalyzer:
         
         # Bad: Create new list and use sum()
         grades = []
-        for grade in student['grades']:
-            grades.append(grade['grade'])
+        for grade in student.grades:
+            grades.append(grade.grade)
         
         return sum(grades) / len(grades) if grades else 0
     
     def calculate_student_average_fast(self, student_id):
         """Fast way - use pre-built index and efficient calculation"""
+        # Good: Repeat requests are answered from the cache
+        if student_id in self._avg_cache:
+            return self._avg_cache[student_id]
+        
         # Good: O(1) lookup using dictionary
-        student = self.student_lookup.get(student_id)
-        if not student:
+        row = self._student_row.get(student_id)
+        if row is None:
             return None
         
-        # Good: Calculate directly without creating intermediate lists
-        total = sum(grade['grade'] for grade in student['grades'])
-        count = len(student['grades'])
-        
-        return total / count if count > 0 else 0
+        # Good: The student's grades are one contiguous slice, averaged in C
+        start, end = self.student_offsets[row], self.student_offsets[row + 1]
+        average = float(self.grade_table.grade[start:end].mean()) if end > start else 0
+        self._avg_cache[student_id] = average
+        return average
     
     def find_top_students_slow(self, students, subject=None, top_n=10):
         """Slow way to find top students"""
@@ -103,55 +204,65 @@ class StudentGradeAnalyzer:
             if subject:
                 # Bad: Filter grades using a loop
                 subject_grades = []
-                for grade in student['grades']:
-                    if grade['subject'] == subject:
-                        subject_grades.append(grade['grade'])
+                for grade in student.grades:
+                    if grade.subject == subject:
+                        subject_grades.append(grade.grade)
                 
                 if subject_grades:
                     avg = sum(subject_grades) / len(subject_grades)
                 else:
                     continue
             else:
-                grades = [grade['grade'] for grade in student['grades']]
+                grades = [grade.grade for grade in student.grades]
                 avg = sum(grades) / len(grades) if grades else 0
             
-            student_averages.append((student['name'], avg))
+            student_averages.append((student.name, avg))
         
         # Bad: Sort the entire list
-        student_averages.sort(key=lambda x: x[1], reverse=True)
+        student_averages.sort(key=itemgetter(1), reverse=True)
         return student_averages[:top_n]
     
     def find_top_students_fast(self, subject=None, top_n=10):
-        """Fast way using cached calculations and efficient filtering"""
-        student_averages = []
-        
-        # Good: Use pre-built indexes
-        for student_id, student in self.student_lookup.items():
-            cache_key = (student_id, subject)
+        """Fast way using cached per-subject averages and partial selection"""
+        # Check cache first: every student's average for this subject
+        if subject not in self.grade_cache:
+            if subject is not None and subject not in self.subject_ids:
+                return []
+            grades = self.grade_table.grade
             
-            # Check cache first
-            if cache_key in self.grade_cache:
-                avg = self.grade_cache[cache_key]
+            if njit is not None:
+                # Good: One compiled pass over each student's slice, spread across cores
+                subject_id = -1 if subject is None else self.subject_ids[subject]
+                self.grade_cache[subject] = _student_averages(
+                    grades, self.grade_table.subject, self.student_offsets, subject_id)
             else:
-                if subject:
-                    # Good: Use set membership for fast checking
-                    if subject not in self.subject_sets[student_id]:
-                        continue
-                    
-                    # Good: Use generator expression with filter
-                    subject_grades = [g['grade'] for g in student['grades'] if g['subject'] == subject]
-                    avg = sum(subject_grades) / len(subject_grades) if subject_grades else 0
+                if subject is None:
+                    in_subject = np.ones(len(grades))
                 else:
-                    avg = self.calculate_student_average_fast(student_id)
+                    # Good: Compare small integer subject IDs instead of strings
+                    in_subject = (self.grade_table.subject == self.subject_ids[subject]).astype(np.float64)
                 
-                # Cache the result
-                self.grade_cache[cache_key] = avg
-            
-            if avg > 0:  # Only include students with grades
-                student_averages.append((student['name'], avg))
+                # Good: Sum and count every student's grades in one C-level pass each
+                num_rows = len(self._row_ids)
+                sums = np.bincount(self._grade_row, weights=grades * in_subject, minlength=num_rows)
+                counts = np.bincount(self._grade_row, weights=in_subject, minlength=num_rows)
+                self.grade_cache[subject] = np.divide(sums, counts, out=np.zeros(num_rows),
+                                                      where=counts > 0)
+        
+        averages = self.grade_cache[subject]
+        candidates = np.flatnonzero(averages > 0)  # Only include students with grades
+        
+        # Good: Partition to find the top_n-th best average instead of sorting everyone
+        if 0 < top_n < len(candidates):
+            kth = len(candidates) - top_n
+            cutoff = np.partition(averages[candidates], kth)[kth]
+            candidates = candidates[averages[candidates] >= cutoff]
         
-        # Good: Use built-in sorted() which is optimized
-        return sorted(student_averages, key=lambda x: x[1], reverse=True)[:top_n]
+        # Sort just the finalists (ties keep student order, like a stable sort)
+        order = np.lexsort((self._lookup_pos[candidates], -averages[candidates]))
+        name_by_id = self.grade_table.name_by_id
+        return [(name_by_id[int(self._row_ids[row])], float(averages[row]))
+                for row in candidates[order][:top_n]]
     
     def analyze_grade_distribution_slow(self, students, subject=None):
         """Slow grade distribution analysis"""
@@ -159,9 +270,9 @@ class StudentGradeAnalyzer:
         
         # Bad: Multiple passes through data
         for student in students:
-            for grade in student['grades']:
-                if subject is None or grade['subject'] == subject:
-                    all_grades.append(grade['grade'])
+            for grade in student.grades:
+                if subject is None or grade.subject == subject:
+                    all_grades.append(grade.grade)
         
         if not all_grades:
             return {}
@@ -179,49 +290,28 @@ class StudentGradeAnalyzer:
         }
     
     def analyze_grade_distribution_fast(self, subject=None):
-        """Fast grade distribution - calculate everything in one pass"""
-        count = 0
-        total = 0
-        min_grade = float('inf')
-        max_grade = float('-inf')
-        a_count = b_count = c_count = fail_count = 0
-        
-        # Good: Single pass through data, calculate everything at once
-        for student in self.student_lookup.values():
-            for grade in student['grades']:
-                if subject is None or grade['subject'] == subject:
-                    grade_value = grade['grade']
-                    count += 1
-                    total += grade_value
-                    
-                    # Update min/max
-                    if grade_value < min_grade:
-                        min_grade = grade_value
-                    if grade_value > max_grade:
-                        max_grade = grade_value
-                    
-                    # Count grade categories
-                    if grade_value >= 90:
-                        a_count += 1
-                    elif grade_value >= 80:
-                        b_count += 1
-                    elif grade_value >= 70:
-                        c_count += 1
-                    else:
-                        fail_count += 1
-        
-        if count == 0:
+        """Fast grade distribution - a few vectorized NumPy reductions"""
+        grades = self.grade_table.grade
+        if subject is not None:
+            if subject not in self.subject_ids:
+                return {}
+            grades = grades[self.grade_table.subject == self.subject_ids[subject]]
+        
+        if grades.size == 0:
             return {}
         
+        # Good: Bucket every grade at once (0: failing, 1: C, 2: B, 3: A)
+        buckets = np.bincount(np.digitize(grades, [70, 80, 90]), minlength=4)
+        
         return {
-            'count': count,
-            'average': total / count,
-            'min': min_grade,
-            'max': max_grade,
-            'a_grades': a_count,
-            'b_grades': b_count,
-            'c_grades': c_count,
-            'failing': fail_count
+            'count': int(grades.size),
+            'average': int(grades.sum()) / grades.size,
+            'min': int(grades.min()),
+            'max': int(grades.max()),
+            'a_grades': int(buckets[3]),
+            'b_grades': int(buckets[2]),
+            'c_grades': int(buckets[1]),
+            'failing': int(buckets[0])
         }
     
     def run_performance_comparison(self, students):
@@ -3,6 +3,8 @@
 
 import time
 import string
+import hashlib
+from collections import Counter
 
 class TextProcessor:
     """A class that processes text files efficiently using optimization techniques"""
@@ -10,7 +12,14 @@ class TextProcessor:
     def __init__(self):
         # Pre-calculate things we'll use often (seed improvement!)
         self.word_count_cache = {}
+        self.analysis_cache = {}  # (text digest, use_fast_methods) -> word statistics
+        self.analysis_cache_size = 32  # Oldest entries are dropped beyond this
         self.punctuation_set = set(string.punctuation)  # Set for fast lookup
+        self._clean_table = str.maketrans({c: ' ' for c in string.punctuation})  # Punctuation -> space
+        # Same table that also lowercases A-Z, so ASCII text needs only one pass
+        self._ascii_clean_table = str.maketrans(
+            {**{c: c.lower() for c in string.ascii_uppercase},
+             **{c: ' ' for c in string.punctuation}})
         
     def clean_text_slow(self, text):
         """Slow version - shows what NOT to do"""
@@ -25,10 +34,11 @@ class TextProcessor:
     
     def clean_text_fast(self, text):
         """Fast version - applies our optimization techniques"""
-        # Good: Use list comprehension and pre-calculated set
-        chars = [char if char not in self.punctuation_set else ' ' 
-                for char in text.lower()]
-        return ''.join(chars)  # Fast: join method
+        # Good: str.translate swaps every character in one C loop using the
+        # pre-calculated table, with no Python code run per character
+        if text.isascii():
+            return text.translate(self._ascii_clean_table)  # Lowercases in the same pass
+        return text.lower().translate(self._clean_table)
     
     def count_words_slow(self, text):
         """Slow word counting"""
@@ -44,19 +54,16 @@ class TextProcessor:
     
     def count_words_fast(self, text):
         """Fast word counting with caching"""
-        # Check if we've already processed this text
-        text_id = hash(text)
-        if text_id in self.word_count_cache:
-            return self.word_count_cache[text_id]
+        # Check if we've already processed this text (keyed by the text itself:
+        # two different strings can share a hash() value, but never compare equal)
+        if text in self.word_count_cache:
+            return self.word_count_cache[text]
         
-        # Good: Count as we go, using get() method
-        words = text.split()
-        word_counts = {}
-        for word in words:
-            word_counts[word] = word_counts.get(word, 0) + 1
+        # Good: Counter tallies every word in C (and is still a dict)
+        word_counts = Counter(text.split())
         
         # Cache the result for next time
-        self.word_count_cache[text_id] = word_counts
+        self.word_count_cache[text] = word_counts
         return word_counts
     
     def find_common_words_slow(self, word_counts, min_count=5):
@@ -73,7 +80,17 @@ class TextProcessor:
     
     def analyze_text(self, text, use_fast_methods=True):
         """Complete text analysis using fast or slow methods"""
-        results = {}
+        # Repeat analyses of the same text are served from the cache. The key is
+        # a SHA-256 digest so the cache doesn't keep 32 whole texts alive
+        start_time = time.time()
+        cache_key = (hashlib.sha256(text.encode()).digest(), use_fast_methods)
+        if cache_key in self.analysis_cache:
+            print("Using cached results...")
+            lookup_time = time.time() - start_time
+            # Fresh dict with this call's own timing, so callers can't change the cache
+            return {**self.analysis_cache[cache_key],
+                    'times': {'cleaning': 0.0, 'counting': 0.0,
+                              'finding_common': 0.0, 'total': lookup_time}}
         
         if use_fast_methods:
             print("Using optimized methods...")
@@ -123,6 +140,12 @@ class TextProcessor:
             }
         }
         
+        # Cache the word statistics (not the timings), dropping the oldest entry
+        # once the cache is full
+        if len(self.analysis_cache) >= self.analysis_cache_size:
+            del self.analysis_cache[next(iter(self.analysis_cache))]
+        self.analysis_cache[cache_key] = {key: value for key, value in results.items() if key != 'times'}
+        
         return results
 
 # Demo the text processor
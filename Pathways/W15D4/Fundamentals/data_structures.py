@@ -3,6 +3,15 @@
 
 import time
 
+import numpy as np
+
+# Numba is optional; Example 4 only runs when it is installed
+try:
+    from numba import njit, types
+    from numba.typed import Dict
+except ImportError:
+    njit = None
+
 # Example 1: Finding items - List vs Set
 print("=== Finding Items: List vs Set ===")
 
@@ -93,12 +102,15 @@ def fast_remove_duplicates(items):
 # Method 3: Using set but keeping order (fastest of ordered methods)
 def ordered_remove_duplicates(items):
     seen = set()
-    result = []
+    # Pre-allocate for the worst case (no duplicates), then trim to what was used
+    result = [None] * len(items)
+    count = 0
     for item in items:
         if item not in seen:
             seen.add(item)
-            result.append(item)
-    return result
+            result[count] = item
+            count += 1
+    return result[:count]
 
 # Time each method
 start_time = time.time()
@@ -117,4 +129,45 @@ print(f"Slow method (with order): {slow_time:.4f} seconds")
 print(f"Fast method (no order): {fast_time:.4f} seconds")
 print(f"Ordered method: {ordered_time:.4f} seconds")
 
+# Example 4: Compiling the loops for integer data
+# Numba can turn a simple loop into machine code, but only for types like
+# numbers - strings still need the Python versions above
+if njit is not None:
+    print("\n=== Compiled Versions for Integer Data (Numba) ===")
+    
+    @njit(cache=True)
+    def fastest_count_ints(values):
+        counts = Dict.empty(key_type=types.int64, value_type=types.int64)
+        for value in values:
+            counts[value] = counts.get(value, 0) + 1
+        return counts
+    
+    @njit(cache=True)
+    def ordered_remove_duplicates_ints(values):
+        seen = set()
+        result = []
+        for value in values:
+            if value not in seen:
+                seen.add(value)
+                result.append(value)
+        return result
+    
+    numbers_array = np.array(numbers_with_duplicates, dtype=np.int64)
+    
+    # The first call compiles each function, so warm them up before timing
+    fastest_count_ints(numbers_array[:1])
+    ordered_remove_duplicates_ints(numbers_array[:1])
+    
+    start_time = time.time()
+    compiled_counts = fastest_count_ints(numbers_array)
+    count_time = time.time() - start_time
+    
+    start_time = time.time()
+    compiled_unique = ordered_remove_duplicates_ints(numbers_array)
+    compiled_time = time.time() - start_time
+    
+    print(f"Compiled counting: {count_time:.4f} seconds")
+    print(f"Compiled ordered method: {compiled_time:.4f} seconds")
+    print(f"Same result as the ordered method: {list(compiled_unique) == ordered_unique}")
+
 print("\n🎯 Key Takeaway: The right data structure makes a huge difference!")
\ No newline at end of file
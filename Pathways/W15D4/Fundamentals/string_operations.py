@@ -19,6 +19,14 @@ def slow_string_join(word_list):
 def fast_string_join(word_list):
     return " ".join(word_list)
 
+# Another fast way: write bytes into one growing buffer and decode once at the end
+def bytearray_string_join(word_list):
+    buffer = bytearray()
+    for word in word_list:
+        buffer += word.encode('ascii')  # bytearray grows in place, no new string each time
+        buffer += b" "
+    return buffer[:-1].decode('ascii')
+
 # Time the slow way
 start_time = time.time()
 slow_result = slow_string_join(words)
@@ -29,8 +37,14 @@ start_time = time.time()
 fast_result = fast_string_join(words)
 fast_time = time.time() - start_time
 
+# Time the bytearray way
+start_time = time.time()
+buffer_result = bytearray_string_join(words)
+buffer_time = time.time() - start_time
+
 print(f"Using += took: {slow_time:.4f} seconds")
 print(f"Using join() took: {fast_time:.4f} seconds")
+print(f"Using a bytearray took: {buffer_time:.4f} seconds")
 print(f"Speed improvement: {slow_time/fast_time:.2f}x faster")
 
 # Example 2: String formatting methods
@@ -41,13 +55,15 @@ age = 25
 city = "New York"
 
 # Different ways to format strings (from slowest to fastest)
-def old_formatting():
+# The values are bound as default arguments so each call reads fast locals
+# instead of looking up globals, and the timings compare only the formatting
+def old_formatting(name=name, age=age, city=city):
     return "Hello, my name is %s, I'm %d years old, and I live in %s." % (name, age, city)
 
-def format_method():
+def format_method(name=name, age=age, city=city):
     return "Hello, my name is {}, I'm {} years old, and I live in {}.".format(name, age, city)
 
-def f_string_formatting():
+def f_string_formatting(name=name, age=age, city=city):
     return f"Hello, my name is {name}, I'm {age} years old, and I live in {city}."
 
 # Time each method (run many times to see the difference)
@@ -73,10 +89,10 @@ text = "Hello, this is a sample text for testing purposes."
 
 # Multiple ways to check if string starts with "Hello"
 def using_slice():
-    return text[:5] == "Hello"
+    return text[:5] == "Hello"  # Builds a new 5-character string on every call
 
 def using_startswith():
-    return text.startswith("Hello")
+    return text.startswith("Hello")  # Compares in place, nothing new is created
 
 # startswith() is more readable and often faster
 print(f"Using slice [0:5]: {using_slice()}")
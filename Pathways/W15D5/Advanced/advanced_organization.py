@@ -9,6 +9,14 @@ print("Taking our student grade system and making it even better with classes")
 # - Clear variable names (from example 2)  
 # - No code duplication (from example 3)
 
+from bisect import bisect_right
+
+import numpy as np
+
+# Letter grade cutoffs (lowest first) and the letter for each band
+GRADE_CUTOFFS = (60, 70, 80, 90)
+LETTER_GRADES = ("F", "D", "C", "B", "A")
+
 class Student:
     """A class to represent a student and their grades"""
     
@@ -16,49 +24,50 @@ class Student:
         """Create a new student with a name"""
         self.name = name
         self.grades = {}  # Dictionary to store subject grades
+        self._avg_cache = None  # Saved average, cleared whenever a grade changes
     
     def add_grade(self, subject, score):
         """Add a grade for a specific subject"""
         self.grades[subject] = score
+        self._avg_cache = None
         print(f"Added {subject} grade of {score} for {self.name}")
     
     def calculate_average(self):
         """Calculate the average of all grades"""
+        if self._avg_cache is not None:  # Already worked out since the last new grade
+            return self._avg_cache
+        
         if not self.grades:  # No grades yet
             return 0
         
         total_points = sum(self.grades.values())
         number_of_subjects = len(self.grades)
-        return total_points / number_of_subjects
+        self._avg_cache = total_points / number_of_subjects
+        return self._avg_cache
     
-    def get_letter_grade(self):
-        """Get letter grade based on average"""
-        average_score = self.calculate_average()
+    def get_letter_grade(self, average_score=None):
+        """Get letter grade based on average (pass the average if you already have it)"""
+        if average_score is None:
+            average_score = self.calculate_average()
         
-        if average_score >= 90:
-            return "A"
-        elif average_score >= 80:
-            return "B"
-        elif average_score >= 70:
-            return "C"
-        elif average_score >= 60:
-            return "D"
-        else:
-            return "F"
+        # Binary search for how many cutoffs the average reaches
+        return LETTER_GRADES[bisect_right(GRADE_CUTOFFS, average_score)]
     
     def display_report_card(self):
         """Display complete student report"""
-        print(f"\n--- Report Card for {self.name} ---")
+        lines = [f"\n--- Report Card for {self.name} ---"]
         
         # Show individual grades
-        for subject, score in self.grades.items():
-            print(f"{subject}: {score}")
+        lines.extend(f"{subject}: {score}" for subject, score in self.grades.items())
         
         # Show average and letter grade
         average_score = self.calculate_average()
-        letter_grade = self.get_letter_grade()
-        print(f"Average: {average_score:.1f}")
-        print(f"Letter Grade: {letter_grade}")
+        letter_grade = self.get_letter_grade(average_score)
+        lines.append(f"Average: {average_score:.1f}")
+        lines.append(f"Letter Grade: {letter_grade}")
+        
+        # Print the whole report card in one call
+        print("\n".join(lines))
 
 
 class Classroom:
@@ -82,14 +91,24 @@ class Classroom:
             print("No students in this class yet.")
             return
         
-        total_class_average = 0
-        for student in self.students:
-            student_average = student.calculate_average()
-            print(f"{student.name}: {student_average:.1f} ({student.get_letter_grade()})")
-            total_class_average += student_average
+        # Work out each student's average only once
+        averages = [student.calculate_average() for student in self.students]
+        
+        if len(self.students) > 32:
+            # Big classes: grade everyone at once with NumPy
+            average_array = np.array(averages, dtype=np.float64)
+            letter_index = np.searchsorted(GRADE_CUTOFFS, average_array, side='right')
+            letters = [LETTER_GRADES[i] for i in letter_index]
+            class_average = float(average_array.mean())
+        else:
+            letters = [student.get_letter_grade(average) for student, average in zip(self.students, averages)]
+            class_average = sum(averages) / len(averages)
         
-        class_average = total_class_average / len(self.students)
-        print(f"\nClass Average: {class_average:.1f}")
+        # Print every line in one call
+        lines = [f"{student.name}: {average:.1f} ({letter})"
+                 for student, average, letter in zip(self.students, averages, letters)]
+        lines.append(f"\nClass Average: {class_average:.1f}")
+        print("\n".join(lines))
 
 
 # Using our refactored system
@@ -4,8 +4,69 @@
 print("=== COMPLETE REFACTORED APPLICATION ===")
 print("This combines all refactoring concepts we've learned!")
 
+import functools
+import itertools
 import json
-from typing import List, Dict, Optional
+import sys
+from bisect import bisect_right
+from operator import attrgetter
+from typing import Dict, Optional
+
+import numpy as np
+
+# orjson is optional; it decodes saved files faster, json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Numba is optional; without it letter grades are worked out one student at a time
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Minimum average for each letter grade, best first
+GRADE_SCALE = [
+    (97, "A+"), (93, "A"), (90, "A-"),
+    (87, "B+"), (83, "B"), (80, "B-"),
+    (77, "C+"), (73, "C"), (70, "C-"),
+    (67, "D+"), (63, "D"), (60, "D-"),
+    (0, "F")
+]
+GRADE_CUTOFFS = np.array([min_score for min_score, _ in GRADE_SCALE[:-1]], dtype=np.float64)
+GRADE_LETTERS = [letter for _, letter in GRADE_SCALE]
+# The same scale lowest first, for binary search with bisect
+_ASCENDING_CUTOFFS = tuple(min_score for min_score, _ in reversed(GRADE_SCALE[:-1]))
+_ASCENDING_LETTERS = tuple(letter for _, letter in reversed(GRADE_SCALE))
+
+if njit is not None:
+    @njit(cache=True)
+    def _classify_averages(averages, cutoffs, out):
+        """Store the GRADE_SCALE position of every average in out"""
+        for i in range(averages.size):
+            index = cutoffs.size  # Below every cutoff: "F"
+            for t in range(cutoffs.size):
+                if averages[i] >= cutoffs[t]:
+                    index = t
+                    break
+            out[i] = index
+
+# Student IDs are handed out in order; GradeManager skips any already in use
+_next_student_number = itertools.count(1000)
+
+# Common subject names that are already clean, so they skip normalizing entirely
+_CANONICAL_SUBJECTS = {subject: sys.intern(subject)
+                       for subject in ("Math", "English", "Science", "Python", "History")}
+
+@functools.lru_cache(maxsize=512)
+def _normalize_subject(subject: str) -> str:
+    """Clean up a subject name once; repeats share one interned string"""
+    subject = subject.strip()
+    if not subject:
+        raise ValueError("Subject name cannot be empty")
+    return sys.intern(subject.title())
+
 
 class Grade:
     """Represents a single grade with validation"""
@@ -17,15 +78,20 @@ class Grade:
     
     def _validate_subject(self, subject: str) -> str:
         """Ensure subject name is valid"""
-        if not subject or not subject.strip():
+        canonical = _CANONICAL_SUBJECTS.get(subject)
+        if canonical is not None:
+            return canonical
+        if not subject:
             raise ValueError("Subject name cannot be empty")
-        return subject.strip().title()
+        return _normalize_subject(subject)
     
     def _validate_score(self, score: float) -> float:
         """Ensure score is within valid range"""
-        if not isinstance(score, (int, float)):
+        # Plain floats and ints (the usual case) skip the isinstance check
+        score_type = type(score)
+        if score_type is not float and score_type is not int and not isinstance(score, (int, float)):
             raise TypeError("Score must be a number")
-        if score < 0 or score > 100:
+        if not 0 <= score <= 100:
             raise ValueError("Score must be between 0 and 100")
         return float(score)
     
@@ -41,7 +107,8 @@ class Student:
         """Create a student with validation"""
         self.name = self._validate_name(name)
         self.student_id = student_id or self._generate_id()
-        self.grades: List[Grade] = []
+        self.grades: Dict[str, Grade] = {}  # Subject -> grade
+        self._avg_cache: Optional[float] = None  # Cleared whenever a grade changes
     
     def _validate_name(self, name: str) -> str:
         """Ensure student name is valid"""
@@ -51,8 +118,7 @@ class Student:
     
     def _generate_id(self) -> str:
         """Generate a simple student ID"""
-        import random
-        return f"STU{random.randint(1000, 9999)}"
+        return f"STU{next(_next_student_number)}"
     
     def add_grade(self, subject: str, score: float) -> bool:
         """Add a grade with error handling"""
@@ -60,15 +126,14 @@ class Student:
             new_grade = Grade(subject, score)
             
             # Check if grade already exists for this subject
-            for i, existing_grade in enumerate(self.grades):
-                if existing_grade.subject == new_grade.subject:
-                    print(f"Updating existing {subject} grade from {existing_grade.score} to {score}")
-                    self.grades[i] = new_grade
-                    return True
+            existing_grade = self.grades.get(new_grade.subject)
+            self.grades[new_grade.subject] = new_grade
+            self._avg_cache = None
             
-            # Add new grade
-            self.grades.append(new_grade)
-            print(f"Added {subject} grade of {score} for {self.name}")
+            if existing_grade is not None:
+                print(f"Updating existing {subject} grade from {existing_grade.score} to {score}")
+            else:
+                print(f"Added {subject} grade of {score} for {self.name}")
             return True
             
         except (ValueError, TypeError) as error:
@@ -77,64 +142,61 @@ class Student:
     
     def calculate_average(self) -> float:
         """Calculate average with error handling"""
+        if self._avg_cache is not None:
+            return self._avg_cache
+        
         if not self.grades:
             return 0.0
         
-        total_points = sum(grade.score for grade in self.grades)
-        return round(total_points / len(self.grades), 2)
+        total_points = sum(grade.score for grade in self.grades.values())
+        self._avg_cache = round(total_points / len(self.grades), 2)
+        return self._avg_cache
     
     def get_letter_grade(self) -> str:
         """Convert average to letter grade"""
-        average = self.calculate_average()
-        
-        grade_scale = [
-            (97, "A+"), (93, "A"), (90, "A-"),
-            (87, "B+"), (83, "B"), (80, "B-"),
-            (77, "C+"), (73, "C"), (70, "C-"),
-            (67, "D+"), (63, "D"), (60, "D-"),
-            (0, "F")
-        ]
-        
-        for min_score, letter in grade_scale:
-            if average >= min_score:
-                return letter
-        return "F"
+        # Binary search for how many cutoffs the average reaches
+        return _ASCENDING_LETTERS[bisect_right(_ASCENDING_CUTOFFS, self.calculate_average())]
     
     def get_grades_by_subject(self) -> Dict[str, float]:
         """Get all grades organized by subject"""
-        return {grade.subject: grade.score for grade in self.grades}
+        return {subject: grade.score for subject, grade in self.grades.items()}
     
     def display_transcript(self):
         """Display detailed student transcript"""
-        print(f"\n{'='*50}")
-        print(f"OFFICIAL TRANSCRIPT")
-        print(f"Student: {self.name} (ID: {self.student_id})")
-        print(f"{'='*50}")
+        # Build every line first, then print them all at once
+        lines = [
+            f"\n{'='*50}",
+            "OFFICIAL TRANSCRIPT",
+            f"Student: {self.name} (ID: {self.student_id})",
+            "=" * 50,
+        ]
         
         if not self.grades:
-            print("No grades recorded yet.")
+            lines.append("No grades recorded yet.")
+            print("\n".join(lines))
             return
         
-        # Display individual grades
-        print("COURSE GRADES:")
-        print("-" * 30)
-        for grade in sorted(self.grades, key=lambda g: g.subject):
-            print(f"{grade.subject:.<20} {grade.score:>6.1f}")
+        # Individual grades
+        lines.append("COURSE GRADES:")
+        lines.append("-" * 30)
+        lines.extend(f"{grade.subject:.<20} {grade.score:>6.1f}"
+                     for grade in sorted(self.grades.values(), key=attrgetter('subject')))
         
-        # Display summary
-        print("-" * 30)
+        # Summary
         average = self.calculate_average()
         letter_grade = self.get_letter_grade()
-        print(f"{'GPA':.<20} {average:>6.2f}")
-        print(f"{'Letter Grade':.<20} {letter_grade:>6}")
-        print("=" * 50)
+        lines.append("-" * 30)
+        lines.append(f"{'GPA':.<20} {average:>6.2f}")
+        lines.append(f"{'Letter Grade':.<20} {letter_grade:>6}")
+        lines.append("=" * 50)
+        print("\n".join(lines))
     
     def to_dict(self) -> Dict:
         """Convert student to dictionary for saving"""
         return {
             'name': self.name,
             'student_id': self.student_id,
-            'grades': [{'subject': g.subject, 'score': g.score} for g in self.grades]
+            'grades': [{'subject': g.subject, 'score': g.score} for g in self.grades.values()]
         }
     
     @classmethod
@@ -153,12 +215,17 @@ class GradeManager:
         """Initialize the grade management system"""
         self.class_name = class_name
         self.students: Dict[str, Student] = {}
+        self._name_index: Dict[str, str] = {}  # Lowercase name -> student ID
     
     def add_student(self, name: str) -> Optional[Student]:
         """Add a new student with error handling"""
         try:
             student = Student(name)
+            # IDs restart at STU1000 in every run, so skip any loaded from a file
+            while student.student_id in self.students:
+                student.student_id = student._generate_id()
             self.students[student.student_id] = student
+            self._name_index.setdefault(student.name.lower(), student.student_id)
             print(f"Successfully added {student.name} (ID: {student.student_id})")
             return student
         except ValueError as error:
@@ -171,12 +238,9 @@ class GradeManager:
         if identifier in self.students:
             return self.students[identifier]
         
-        # Then try to find by name
-        for student in self.students.values():
-            if student.name.lower() == identifier.lower():
-                return student
-        
-        return None
+        # Then try to find by name with the name index
+        student_id = self._name_index.get(identifier.lower())
+        return self.students.get(student_id) if student_id else None
     
     def add_grade_to_student(self, student_identifier: str, subject: str, score: float) -> bool:
         """Add grade to specific student"""
@@ -198,31 +262,50 @@ class GradeManager:
             return
         
         students_list = list(self.students.values())
-        students_list.sort(key=lambda s: s.calculate_average(), reverse=True)
         
-        print(f"{'Rank':<6} {'Name':<20} {'ID':<10} {'Average':<8} {'Grade'}")
-        print("-" * 60)
+        # Every average in one contiguous array, ranked and averaged by NumPy
+        averages = np.fromiter((s.calculate_average() for s in students_list),
+                               dtype=np.float64, count=len(students_list))
+        ranking = np.argsort(-averages, kind='stable')  # Highest first, ties keep their order
+        
+        # Big classes get every letter grade from one compiled pass; for small
+        # ones the compile time would cost more than it saves
+        if njit is not None and len(students_list) >= 64:
+            letter_index = np.empty(len(students_list), dtype=np.uint8)
+            _classify_averages(averages, GRADE_CUTOFFS, letter_index)
+            letters = [GRADE_LETTERS[i] for i in letter_index]
+        else:
+            letters = [student.get_letter_grade() for student in students_list]
+        
+        # Build every line first, then print them all at once
+        lines = [f"{'Rank':<6} {'Name':<20} {'ID':<10} {'Average':<8} {'Grade'}", "-" * 60]
         
-        for rank, student in enumerate(students_list, 1):
-            avg = student.calculate_average()
-            grade = student.get_letter_grade()
-            print(f"{rank:<6} {student.name:<20} {student.student_id:<10} {avg:<8.2f} {grade}")
+        for rank, index in enumerate(ranking, 1):
+            student = students_list[index]
+            avg = averages[index]
+            grade = letters[index]
+            lines.append(f"{rank:<6} {student.name:<20} {student.student_id:<10} {avg:<8.2f} {grade}")
         
         # Class statistics
-        class_average = sum(s.calculate_average() for s in students_list) / len(students_list)
-        print("-" * 60)
-        print(f"Class Average: {class_average:.2f}")
-        print(f"Total Students: {len(students_list)}")
+        class_average = averages.mean()
+        lines.append("-" * 60)
+        lines.append(f"Class Average: {class_average:.2f}")
+        lines.append(f"Total Students: {len(students_list)}")
+        print("\n".join(lines))
     
     def save_to_file(self, filename: str) -> bool:
         """Save class data to JSON file"""
         try:
-            data = {
-                'class_name': self.class_name,
-                'students': [student.to_dict() for student in self.students.values()]
-            }
+            # Write one student at a time instead of building the whole class
+            # first; the layout matches json.dump(data, file, indent=2)
             with open(filename, 'w') as file:
-                json.dump(data, file, indent=2)
+                file.write('{\n  "class_name": ' + json.dumps(self.class_name) + ',\n  "students": [')
+                for i, student in enumerate(self.students.values()):
+                    # JSON strings never contain raw newlines, so indenting
+                    # after each newline nests the student two levels deep
+                    student_json = json.dumps(student.to_dict(), indent=2).replace('\n', '\n    ')
+                    file.write((',\n    ' if i else '\n    ') + student_json)
+                file.write('\n  ]\n}' if self.students else ']\n}')
             print(f"Class data saved to {filename}")
             return True
         except Exception as error:
@@ -232,15 +315,17 @@ class GradeManager:
     def load_from_file(self, filename: str) -> bool:
         """Load class data from JSON file"""
         try:
-            with open(filename, 'r') as file:
-                data = json.load(file)
+            with open(filename, 'rb') as file:
+                data = orjson.loads(file.read()) if orjson is not None else json.load(file)
             
             self.class_name = data['class_name']
             self.students = {}
+            self._name_index = {}
             
             for student_data in data['students']:
                 student = Student.from_dict(student_data)
                 self.students[student.student_id] = student
+                self._name_index.setdefault(student.name.lower(), student.student_id)
             
             print(f"Class data loaded from {filename}")
             return True
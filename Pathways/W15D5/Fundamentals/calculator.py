@@ -14,14 +14,12 @@ def subtract(a, b):
 
 def multiply(a, b):
     result = a * b
-    print("Multiplying " + str(a) + " and " + str(b))
-    print("Result is: " + str(result))
+    print(f"Multiplying {a} and {b}\nResult is: {result}")
     return result
 
 def divide(a, b):
     result = a / b
-    print("Dividing " + str(a) + " by " + str(b))
-    print("Result is: " + str(result))
+    print(f"Dividing {a} by {b}\nResult is: {result}")
     return result
 
 # Usage
@@ -1,14 +1,17 @@
+import numpy as np
+
 students = [
     {"name": "Alice", "math": 85, "english": 92, "science": 78},
     {"name": "Bob", "math": 90, "english": 88, "science": 95},
     {"name": "Charlie", "math": 76, "english": 84, "science": 89}
 ]
 
-def calculate_average(student):
-    total = student["math"] + student["english"] + student["science"]
-    avg = total / 3
-    print(f"{student['name']}'s average: {avg}")
-    return avg
+# All the scores in one (students x subjects) array, so every average
+# comes from a single NumPy call instead of one function call per student
+names = [student["name"] for student in students]
+scores = np.array([[student["math"], student["english"], student["science"]] for student in students],
+                  dtype=np.float64)
+averages = scores.mean(axis=1)
 
-for student in students:
-    calculate_average(student)
\ No newline at end of file
+for name, avg in zip(names, averages):
+    print(f"{name}'s average: {avg}")
\ No newline at end of file
@@ -152,44 +152,36 @@ plt.savefig('temperature_timeseries.png')
 print("Plot saved as 'temperature_timeseries.png'")
 
 # 2. Multiple time series plot with subplots
-plt.figure(figsize=(12, 8))
+# Create the figure and all three axes in one call, then fill each axis
+fig, axes = plt.subplots(3, 1, figsize=(12, 8))
 
 # Calculate various time series derived from the original data
 weather_df['temp_7d_avg'] = weather_df['temperature'].rolling(window=7).mean()
 weather_df['temp_90d_avg'] = weather_df['temperature'].rolling(window=90).mean()
 weather_df['temp_365d_avg'] = weather_df['temperature'].rolling(window=365).mean()
 
-# Subplot 1: Original data with trend
-plt.subplot(3, 1, 1)
-plt.plot(weather_df.index, weather_df['temperature'], 'b-', alpha=0.3)
-plt.plot(weather_df.index, weather_df['temp_365d_avg'], 'r-', linewidth=2)
-plt.title('Daily Temperature with Annual Moving Average', fontsize=12)
-plt.ylabel('Temp (°C)')
-plt.grid(True, alpha=0.3)
-
-# Subplot 2: Seasonal patterns
-plt.subplot(3, 1, 2)
-plt.plot(weather_df.index, weather_df['temperature'], 'b-', alpha=0.3)
-plt.plot(weather_df.index, weather_df['temp_90d_avg'], 'g-', linewidth=2)
-plt.title('Daily Temperature with Quarterly Moving Average', fontsize=12)
-plt.ylabel('Temp (°C)')
-plt.grid(True, alpha=0.3)
-
-# Subplot 3: Short-term fluctuations
-plt.subplot(3, 1, 3)
-plt.plot(weather_df.index, weather_df['temperature'], 'b-', alpha=0.3)
-plt.plot(weather_df.index, weather_df['temp_7d_avg'], 'c-', linewidth=2)
-plt.title('Daily Temperature with Weekly Moving Average', fontsize=12)
-plt.ylabel('Temp (°C)')
-plt.grid(True, alpha=0.3)
-
-# Format the x-axis for all subplots
-for ax in plt.gcf().get_axes():
+# Each subplot overlays the daily data with one moving average
+subplot_specs = [
+    # Subplot 1: Original data with trend
+    ('temp_365d_avg', 'r-', 'Daily Temperature with Annual Moving Average'),
+    # Subplot 2: Seasonal patterns
+    ('temp_90d_avg', 'g-', 'Daily Temperature with Quarterly Moving Average'),
+    # Subplot 3: Short-term fluctuations
+    ('temp_7d_avg', 'c-', 'Daily Temperature with Weekly Moving Average'),
+]
+for ax, (avg_col, style, title) in zip(axes, subplot_specs):
+    ax.plot(weather_df.index, weather_df['temperature'], 'b-', alpha=0.3)
+    ax.plot(weather_df.index, weather_df[avg_col], style, linewidth=2)
+    ax.set_title(title, fontsize=12)
+    ax.set_ylabel('Temp (°C)')
+    ax.grid(True, alpha=0.3)
+
+    # Label this subplot's x-axis by year
     ax.xaxis.set_major_locator(mdates.YearLocator())
     ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y'))
 
-plt.tight_layout()
-plt.savefig('temperature_trends_subplots.png')
+fig.tight_layout()
+fig.savefig('temperature_trends_subplots.png')
 
 print("Plot saved as 'temperature_trends_subplots.png'")
 
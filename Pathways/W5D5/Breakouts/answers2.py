@@ -7,6 +7,8 @@ INSTRUCTOR VERSION: This file contains complete solutions for the breakout sessi
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Every plot is saved to a file, so no GUI window is needed
 import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
 import matplotlib.dates as mdates
@@ -85,19 +87,17 @@ print("Monthly averages (first 5 months):")
 print(monthly_data.head())
 
 # 2. Calculate seasonal statistics
-# Define a function to assign seasons based on month
-def assign_season(month):
-    if month in [12, 1, 2]:
-        return 'Winter'
-    elif month in [3, 4, 5]:
-        return 'Spring'
-    elif month in [6, 7, 8]:
-        return 'Summer'
-    else:
-        return 'Fall'
+# Season for each month number (index 0 is unused), so every row's season
+# is one array lookup instead of a Python function call per row
+SEASON_BY_MONTH = np.array(['', 'Winter', 'Winter', 'Spring', 'Spring', 'Spring', 'Summer',
+                            'Summer', 'Summer', 'Fall', 'Fall', 'Fall', 'Winter'], dtype=object)
+
+# Month and year of every row, worked out once from the index and reused below
+months = weather_data.index.month.to_numpy().astype(np.int8)
+row_years = weather_data.index.year.to_numpy().astype(np.int16)
 
 # Add a season column
-weather_data['season'] = weather_data.index.map(lambda x: assign_season(x.month))
+weather_data['season'] = SEASON_BY_MONTH[months]
 
 # Calculate seasonal statistics
 seasonal_stats = weather_data.groupby('season').agg({
@@ -165,7 +165,7 @@ plt.savefig('monthly_precipitation.png')
 plt.figure(figsize=(14, 6))
 
 # Group by month and plot
-monthly_groups = weather_data.groupby(weather_data.index.month)['temperature']
+monthly_groups = weather_data['temperature'].groupby(months)
 box_data = [group[1].values for group in monthly_groups]
 plt.boxplot(box_data)
 
@@ -188,10 +188,12 @@ plt.figure(figsize=(10, 6))
 season_colors = {'Winter': 'blue', 'Spring': 'green', 'Summer': 'red', 'Fall': 'orange'}
 
 # Plot each season with different colors
+# rasterized=True draws the points as one image while the axes stay sharp,
+# which keeps PDF/SVG exports small and fast even with hourly data
 for season in season_colors:
     season_data = weather_data[weather_data['season'] == season]
-    plt.scatter(season_data['temperature'], season_data['humidity'], 
-                alpha=0.5, label=season, color=season_colors[season])
+    plt.scatter(season_data['temperature'].to_numpy(), season_data['humidity'].to_numpy(), 
+                alpha=0.5, label=season, color=season_colors[season], rasterized=True)
 
 plt.title('Temperature vs. Humidity by Season')
 plt.xlabel('Temperature (°C)')
@@ -209,7 +211,7 @@ plt.savefig('temp_humidity_scatter.png')
 plt.figure(figsize=(14, 8))
 
 # Get unique years in the dataset
-years = sorted(weather_data.index.year.unique())
+years = np.unique(row_years).tolist()
 
 # Create a subplot for each month
 for i, month in enumerate(range(1, 13)):
@@ -218,8 +220,7 @@ for i, month in enumerate(range(1, 13)):
     # Plot each year's data for this month
     for year in years:
         # Filter data for this month and year
-        month_data = weather_data[(weather_data.index.month == month) & 
-                                 (weather_data.index.year == year)]
+        month_data = weather_data[(months == month) & (row_years == year)]
         
         # Plot the data
         days_of_month = month_data.index.day
@@ -250,12 +251,19 @@ plt.savefig('year_over_year.png')
 # 2. Create a heatmap of average temperatures by month and year
 plt.figure(figsize=(12, 8))
 
-# Create a pivot table with months as rows and years as columns
-pivot_data = weather_data['temperature'].groupby([weather_data.index.year, 
-                                                 weather_data.index.month]).mean().unstack()
-
-# Create a heatmap
-plt.imshow(pivot_data, aspect='auto', cmap='viridis')
+# Create a pivot table of average temperatures for each (year, month) cell
+# Packing the pair into one number lets np.bincount add up every cell in a
+# single pass, instead of grouping on (year, month) pairs
+cell = np.searchsorted(years, row_years) * 12 + (months - 1)
+n_cells = len(years) * 12
+sums = np.bincount(cell, weights=weather_data['temperature'].to_numpy(), minlength=n_cells)
+counts = np.bincount(cell, minlength=n_cells)
+pivot_values = np.divide(sums, counts, out=np.full(n_cells, np.nan), where=counts > 0)
+pivot_values = pivot_values.reshape(len(years), 12)
+
+# Create a heatmap from the plain array; 'nearest' draws each cell as a
+# solid block instead of smoothing between neighbouring cells
+plt.imshow(pivot_values, aspect='auto', cmap='viridis', interpolation='nearest')
 plt.colorbar(label='Average Temperature (°C)')
 
 # Add labels
@@ -265,10 +273,11 @@ plt.xlabel('Year')
 plt.ylabel('Month')
 
 # Add text annotations
-for i in range(len(pivot_data.index)):
-    for j in range(len(pivot_data.columns)):
-        text_color = 'white' if pivot_data.iloc[i, j] > pivot_data.values.mean() else 'black'
-        plt.text(j, i, f'{pivot_data.iloc[i, j]:.1f}', 
+overall_mean = pivot_values.mean()
+for i in range(pivot_values.shape[0]):
+    for j in range(pivot_values.shape[1]):
+        text_color = 'white' if pivot_values[i, j] > overall_mean else 'black'
+        plt.text(j, i, f'{pivot_values[i, j]:.1f}', 
                 ha='center', va='center', color=text_color)
 
 plt.title('Monthly Average Temperature Heatmap')
@@ -4,6 +4,7 @@ BREAKOUT ROOM 2: BUILDING SIMPLE WEATHER FORECASTING MODELS - ANSWER KEY
 This file provides complete solutions for the weather forecasting model building activity.
 """
 
+import os
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
@@ -16,6 +17,13 @@ from sklearn.ensemble import RandomForestRegressor
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 import warnings
 
+# pyarrow is optional; it reads CSV files much faster than pandas' own parser
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:
+    pacsv = None
+
 # Suppress warnings for cleaner output
 warnings.filterwarnings('ignore')
 
@@ -61,16 +69,46 @@ def generate_data(days=365):
     df['temp_lag7'] = df['temperature'].shift(7)  # Temperature 1 week ago
     df['temp_ma7'] = df['temperature'].rolling(window=7).mean()  # 7-day average
     
-    # Drop rows with NaN values
-    df = df.dropna()
+    # Drop rows with NaN values - only the lag and rolling columns can have
+    # them, so check just those instead of scanning every column
+    has_history = df[['temp_lag1', 'temp_lag7', 'temp_ma7']].notna().all(axis=1).to_numpy()
+    df = df[has_history]
     
     return df
 
+def read_weather_csv(path):
+    """Read the processed weather CSV with a datetime 'date' index"""
+    if pacsv is None:
+        # Parse the file 100,000 rows at a time so the parser only works on
+        # one block of text at once, even for decades of hourly readings
+        chunks = pd.read_csv(path, index_col='date', parse_dates=True, chunksize=100_000)
+        return pd.concat(chunks)
+    
+    # Parse the dates inside pyarrow, then hand each column to pandas as its
+    # own block so nothing is copied into one combined array
+    convert_options = pacsv.ConvertOptions(column_types={'date': pa.timestamp('ns')})
+    table = pacsv.read_csv(path, convert_options=convert_options)
+    return table.to_pandas(split_blocks=True, self_destruct=True).set_index('date')
+
 # ANSWER: Load or generate weather data
+# After the CSV has been parsed once it is saved as Parquet, which loads much
+# faster on later runs because the dates and numbers are stored ready to use.
+# The cache is only trusted while it is newer than the CSV it came from
+WEATHER_CSV = 'weather_processed.csv'
+PARQUET_CACHE = 'weather_processed.parquet'
 try:
-    # Try to load from file if it exists
-    weather_data = pd.read_csv('weather_processed.csv', index_col='date', parse_dates=True)
-    print("Loaded processed weather data from file.")
+    if (os.path.exists(PARQUET_CACHE)
+            and os.path.getmtime(PARQUET_CACHE) >= os.path.getmtime(WEATHER_CSV)):
+        weather_data = pd.read_parquet(PARQUET_CACHE)
+        print("Loaded processed weather data from the Parquet cache.")
+    else:
+        # Try to load from file if it exists
+        weather_data = read_weather_csv(WEATHER_CSV)
+        print("Loaded processed weather data from file.")
+        try:
+            weather_data.to_parquet(PARQUET_CACHE)
+        except ImportError:
+            pass  # Parquet needs pyarrow; without it we just read the CSV each time
 except FileNotFoundError:
     # Generate synthetic data if file doesn't exist
     weather_data = generate_data()